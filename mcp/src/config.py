@@ -47,6 +47,9 @@ class Config:
     DEFAULT_HOST = os.getenv("MCP_SERVER_HOST", "127.0.0.1")
     DEFAULT_TRANSPORT = os.getenv("MCP_TRANSPORT", "stdio")
 
+    # Debugging - include formatted tracebacks in tool error responses
+    DEBUG = os.getenv("PM_DEBUG", "").lower() in ("1", "true", "yes")
+
     # Project defaults
     DEFAULT_PROJECT_ID: Optional[str] = os.getenv("PM_DEFAULT_PROJECT_ID")
     DEFAULT_OWNER = os.getenv("PM_DEFAULT_OWNER", "agent:claude-code")
@@ -60,6 +63,10 @@ class Config:
     GIT_USER_NAME = os.getenv("GIT_USER_NAME", "Claude Code Agent")
     GIT_USER_EMAIL = os.getenv("GIT_USER_EMAIL", "noreply@anthropic.com")
 
+    # Database connection pool / SQLite memory-mapped I/O (0 disables mmap)
+    DB_MAX_CONNECTIONS = int(os.getenv("PM_DB_MAX_CONNECTIONS", "8"))
+    DB_MMAP_SIZE = int(os.getenv("PM_DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+
     # Limits
     MAX_ISSUES_PER_LIST = int(os.getenv("PM_MAX_ISSUES", "100"))
     MAX_WORKLOGS_PER_LIST = int(os.getenv("PM_MAX_WORKLOGS", "50"))
@@ -1,13 +1,32 @@
 """Database connection and repository layer for PM MCP Server - NO RAW SQL"""
 import json
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Sequence, Union
 from peewee import *
 from peewee import fn
+from playhouse.pool import PooledSqliteDatabase
 from config import Config
 from utils import safe_json_loads
 
+# JSON text columns (specification, planning, details, context, ...) are
+# decoded on every issue read; use orjson when available. orjson errors
+# subclass json.JSONDecodeError, so existing except clauses still apply.
+# Both encoders write the same text: compact separators, raw UTF-8, and
+# non-str dict keys converted to strings.
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
 def _safe_json(val, default):
     """Safe JSON parsing with fallback"""
     if not val:
@@ -15,10 +34,19 @@ def _safe_json(val, default):
     try:
         if isinstance(val, (dict, list)):
             return val
-        return json.loads(val)
+        return _json_loads(val)
     except Exception:
         return default
 
+def _dependency_view(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Issue fields dependency analysis reads, from a key/title/status/planning row"""
+    return {
+        'key': row['key'],
+        'title': row['title'],
+        'status': row['status'],
+        'dependencies': _safe_json(row['planning'], {}).get('dependencies', [])
+    }
+
 def _get_issue_field_json(issue, field_name):
     """Get JSON field from issue safely"""
     return _safe_json(getattr(issue, field_name, None), {})
@@ -54,7 +82,7 @@ class Project(BaseModel):
     """Project model"""
     project_id = CharField(unique=True, index=True, max_length=64)
     project_slug = CharField(index=True, max_length=100)
-    absolute_path = CharField(max_length=500)
+    absolute_path = CharField(index=True, max_length=500)
     metadata = TextField(null=True)  # JSON
     created_utc = DateTimeField(index=True)
     updated_utc = DateTimeField(index=True)
@@ -64,7 +92,7 @@ class Project(BaseModel):
         if not self.metadata:
             return {}
         try:
-            return json.loads(self.metadata)
+            return _json_loads(self.metadata)
         except (json.JSONDecodeError, TypeError):
             return {}
 
@@ -104,7 +132,7 @@ class Issue(BaseModel):
         if not field_value:
             return {}
         try:
-            return json.loads(field_value)
+            return _json_loads(field_value)
         except (json.JSONDecodeError, TypeError):
             return {}
 
@@ -135,18 +163,31 @@ class Issue(BaseModel):
     def to_rich_dict(self) -> Dict[str, Any]:
         """Convert to dict with all JSON properties expanded"""
         data = self.to_dict()
+        # Parse each JSON column once rather than once per derived property
+        spec = self.get_json_field('specification')
+        plan = self.get_json_field('planning')
+        impl = self.get_json_field('implementation')
         data.update({
-            'description': self.description,
-            'acceptance_criteria': self.acceptance_criteria,
-            'dependencies': self.dependencies,
-            'estimated_effort': self.estimated_effort,
-            'complexity': self.complexity,
-            'branch_hint': self.branch_hint,
+            'description': spec.get('description', ''),
+            'acceptance_criteria': spec.get('acceptance_criteria', []),
+            'dependencies': plan.get('dependencies', []),
+            'estimated_effort': plan.get('estimated_effort', ''),
+            'complexity': plan.get('complexity', 'Medium'),
+            'branch_hint': impl.get('branch_hint', ''),
             'project_slug': self.project.project_slug,
             'project_path': self.project.absolute_path
         })
         return data
 
+# Statuses a work queue can act on directly (blocked issues are added separately)
+ACTIONABLE_STATUSES = ('proposed', 'in_progress', 'review')
+
+# Per-owner work queue: walk one owner's issues newest-first, as get_issues()
+# orders them, and stop at the limit instead of sorting every match. Not a
+# partial index on the actionable statuses: SQLite can't use one when the
+# IN list is bound as parameters.
+Issue.add_index(Issue.index(Issue.owner, Issue.updated_utc.desc(), name='issue_owner_updated'))
+
 class Task(BaseModel):
     """Task model"""
     issue = ForeignKeyField(Issue, backref='tasks', on_delete='CASCADE')
@@ -163,7 +204,7 @@ class Task(BaseModel):
         if not self.details:
             return {}
         try:
-            return json.loads(self.details)
+            return _json_loads(self.details)
         except (json.JSONDecodeError, TypeError):
             return {}
 
@@ -191,7 +232,7 @@ class WorkLog(BaseModel):
         if not self.artifacts:
             return []
         try:
-            return json.loads(self.artifacts)
+            return _json_loads(self.artifacts)
         except (json.JSONDecodeError, TypeError):
             return []
 
@@ -200,7 +241,7 @@ class WorkLog(BaseModel):
         if not self.context:
             return {}
         try:
-            return json.loads(self.context)
+            return _json_loads(self.context)
         except (json.JSONDecodeError, TypeError):
             return {}
 
@@ -229,6 +270,7 @@ class PMDatabase:
     """Database operations wrapper with proper Peewee usage - NO RAW SQL"""
 
     _db_initialized = False
+    _supports_returning = False  # SQLite >= 3.35 understands RETURNING
 
     # ---------- Converters (models -> dicts) ----------
     @staticmethod
@@ -281,11 +323,11 @@ class PMDatabase:
         artifacts = []
         ctx = {}
         try:
-            artifacts = json.loads(w.artifacts) if w.artifacts else []
+            artifacts = _json_loads(w.artifacts) if w.artifacts else []
         except Exception:
             artifacts = []
         try:
-            ctx = json.loads(w.context) if w.context else {}
+            ctx = _json_loads(w.context) if w.context else {}
         except Exception:
             ctx = {}
         return {
@@ -309,12 +351,26 @@ class PMDatabase:
         db_path = Config.get_database_path()
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Initialize database
-        database = SqliteDatabase(str(db_path))
+        # Initialize pooled database - DatabaseSession checks connections in and
+        # out of the pool instead of reopening the file on every tool call.
+        # Pragmas are applied once per new pooled connection.
+        database = PooledSqliteDatabase(
+            str(db_path),
+            max_connections=Config.DB_MAX_CONNECTIONS,
+            stale_timeout=300,
+            pragmas={
+                'journal_mode': 'wal',
+                'synchronous': 'normal',
+                'cache_size': -64 * 1024,  # 64MB page cache per connection
+                'temp_store': 'memory',  # sorts/temp indexes for GROUP BY stay off disk
+                'mmap_size': Config.DB_MMAP_SIZE,  # reads map pages instead of copying them
+            }
+        )
         db_proxy.initialize(database)
 
         # Create tables if needed
         database.create_tables([Project, Issue, Task, WorkLog, CommandUsage, CommandConfig], safe=True)
+        cls._supports_returning = database.server_version >= (3, 35, 0)
         cls._db_initialized = True
 
     @classmethod
@@ -327,7 +383,7 @@ class PMDatabase:
 
     @classmethod
     def close(cls):
-        """Close database connection"""
+        """Return connection to the pool"""
         if not db_proxy.is_closed():
             db_proxy.close()
 
@@ -341,6 +397,16 @@ class PMDatabase:
         except DoesNotExist:
             return None
 
+    @classmethod
+    def get_project_by_path(cls, path: Union[str, Path]) -> Optional[Project]:
+        """Get project by its resolved absolute path - indexed lookup"""
+        return Project.get_or_none(Project.absolute_path == str(Path(path).resolve()))
+
+    @staticmethod
+    def get_repo_path(project: Project) -> str:
+        """Git root recorded in the project's VCS metadata, else its absolute path"""
+        return project.vcs.get('git_root') or project.absolute_path
+
     @classmethod
     def get_all_projects(cls) -> List[Project]:
         """Get all projects - returns list of Peewee models"""
@@ -356,6 +422,17 @@ class PMDatabase:
         except DoesNotExist:
             return None
 
+    @classmethod
+    def get_issue_with_project(cls, issue_key: str) -> tuple[Optional[Issue], Optional[Project]]:
+        """Get issue by key together with its project in one JOIN query - returns Peewee models"""
+        if not issue_key:
+            return None, None
+        try:
+            issue = Issue.select(Issue, Project).join(Project).where(Issue.key == issue_key).get()
+        except DoesNotExist:
+            return None, None
+        return issue, issue.project
+
     @classmethod
     def get_issue_scoped(cls, project_id: str, issue_key: str) -> Optional[Issue]:
         """Fetch an issue by key but only if it belongs to project_id."""
@@ -378,7 +455,48 @@ class PMDatabase:
         query = (Issue.select()
                 .join(Project)
                 .where(Project.project_id == project_id))
+        return list(cls._filter_issues(query, filters))
 
+    @classmethod
+    def find_issue_dicts(cls, project_id: str, **filters) -> List[Dict[str, Any]]:
+        """
+        find_issues() as Issue.to_rich_dict() shaped dicts, built from plain rows.
+        Skips model instantiation, the per-issue project lazy load, and repeated
+        JSON parsing of the same column for list views.
+        """
+        project = Project.get_or_none(Project.project_id == project_id) if project_id else None
+        if not project:
+            return []
+        project_dict = project.to_dict()
+        field_names = [f.name for f in Issue._meta.sorted_fields]
+
+        result = []
+        rows = cls._filter_issues(Issue.select().where(Issue.project == project), filters).dicts()
+        for row in rows:
+            data = {}
+            for name in field_names:
+                value = row[name]
+                data[name] = value.isoformat() + 'Z' if isinstance(value, datetime) else value
+            data['project'] = project_dict
+            spec = _safe_json(row['specification'], {})
+            plan = _safe_json(row['planning'], {})
+            impl = _safe_json(row['implementation'], {})
+            data.update({
+                'description': spec.get('description', ''),
+                'acceptance_criteria': spec.get('acceptance_criteria', []),
+                'dependencies': plan.get('dependencies', []),
+                'estimated_effort': plan.get('estimated_effort', ''),
+                'complexity': plan.get('complexity', 'Medium'),
+                'branch_hint': impl.get('branch_hint', ''),
+                'project_slug': project.project_slug,
+                'project_path': project.absolute_path
+            })
+            result.append(data)
+        return result
+
+    @staticmethod
+    def _filter_issues(query, filters: Dict[str, Any]):
+        """Apply find_issues() filters and ordering to an Issue query"""
         status = filters.get('status')
         priority = filters.get('priority')
         module = filters.get('module')
@@ -399,10 +517,14 @@ class PMDatabase:
                 (Issue.specification.contains(search)) |
                 (Issue.planning.contains(search))
             )
-        return list(query.order_by(Issue.updated_utc.desc()))
+        return query.order_by(Issue.updated_utc.desc())
 
     @classmethod
-    def find_archived_issues(cls, project_id: str, **filters) -> List[Issue]:
+    def find_archived_issues(cls, project_id: str, *, priority: Optional[str] = None,
+                             module: Optional[str] = None, issue_type: Optional[str] = None,
+                             search_keyword: Optional[str] = None,
+                             date_from: Optional[str] = None,
+                             date_to: Optional[str] = None) -> List[Issue]:
         """Find archived issues with filters - returns Peewee models"""
         if not project_id:
             return []
@@ -410,13 +532,6 @@ class PMDatabase:
                 .join(Project)
                 .where((Project.project_id == project_id) & (Issue.status == 'archived')))
 
-        priority = filters.get('priority')
-        module = filters.get('module')
-        issue_type = filters.get('type')
-        search_keyword = filters.get('search_keyword')
-        date_from = filters.get('date_from')
-        date_to = filters.get('date_to')
-
         if priority:
             query = query.where(Issue.priority == priority)
         if module:
@@ -439,29 +554,68 @@ class PMDatabase:
     def get_archived_issue(cls, project_id: str, issue_key: str) -> Optional[Issue]:
         """Get a specific archived issue by key"""
         try:
+            query = Issue.select(Issue, Project).join(Project)
             if project_id:
-                return Issue.select().join(Project).where(
+                return query.where(
                     (Project.project_id == project_id) &
                     (Issue.key == issue_key) &
                     (Issue.status == 'archived')
                 ).first()
             else:
-                return Issue.select().where(
+                return query.where(
                     (Issue.key == issue_key) &
                     (Issue.status == 'archived')
                 ).first()
         except Exception:
             return None
 
+    @classmethod
+    def get_issue_tasks(cls, issue: Issue) -> List[Task]:
+        """Tasks of an issue in one query, each pointing back at the loaded issue"""
+        tasks = list(issue.tasks)
+        for task in tasks:
+            task.issue = issue
+        return tasks
+
+    @classmethod
+    def get_issue_worklogs(cls, issue: Issue, tasks: Optional[List[Task]] = None,
+                           limit: Optional[int] = None, newest_first: bool = False) -> List[WorkLog]:
+        """
+        Worklogs of an issue with their issue and task relations filled in.
+        Tasks already loaded are reused; any others come from one extra query.
+        """
+        query = issue.worklogs
+        if newest_first:
+            query = query.order_by(WorkLog.timestamp_utc.desc())
+        if limit:
+            query = query.limit(limit)
+        worklogs = list(query)
+
+        tasks_by_id = {task.id: task for task in tasks or ()}
+        missing = {w.task_id for w in worklogs if w.task_id and w.task_id not in tasks_by_id}
+        if missing:
+            for task in Task.select().where(Task.id.in_(missing)):
+                if task.issue_id == issue.id:
+                    task.issue = issue
+                tasks_by_id[task.id] = task
+
+        for worklog in worklogs:
+            worklog.issue = issue
+            if worklog.task_id:
+                worklog.task = tasks_by_id[worklog.task_id]
+        return worklogs
+
     @classmethod
     def get_issue_with_relations(cls, issue_key: str) -> Optional[Dict[str, Any]]:
         """Get issue with tasks and worklogs using Peewee relationships"""
         try:
-            issue = Issue.get(Issue.key == issue_key)
+            issue = Issue.select(Issue, Project).join(Project).where(Issue.key == issue_key).get()
 
-            # Use Peewee relationships - no raw SQL!
+            # Use Peewee relationships - no raw SQL! Children get their parent
+            # rows attached so to_dict() does not lazy-load them one by one.
+            task_models = cls.get_issue_tasks(issue)
             tasks = []
-            for task in issue.tasks:  # Auto lazy-loaded backref
+            for task in task_models:
                 task_data = task.to_dict()
                 task_data.update({
                     'checklist': task.checklist,
@@ -470,7 +624,7 @@ class PMDatabase:
                 tasks.append(task_data)
 
             worklogs = []
-            for worklog in issue.worklogs.order_by(WorkLog.timestamp_utc.desc()).limit(20):  # Auto lazy-loaded
+            for worklog in cls.get_issue_worklogs(issue, task_models, limit=20, newest_first=True):
                 worklog_data = worklog.to_dict()
                 worklog_data.update({
                     'artifacts': worklog.get_artifacts(),
@@ -492,8 +646,13 @@ class PMDatabase:
             return None
 
     @classmethod
-    def search_issues(cls, query_text: str, project_id: Optional[str] = None, limit: int = 20, include_archived: bool = False) -> List[Dict[str, Any]]:
-        """Full-text search using Peewee queries"""
+    def search_issues(cls, query_text: str, project_id: Optional[str] = None, limit: int = 20,
+                      include_archived: bool = False, include_content: bool = True) -> List[Dict[str, Any]]:
+        """
+        Full-text search using Peewee queries. Without include_content only the
+        short issue columns are selected - the JSON documents are matched in SQL
+        but never shipped back.
+        """
         # Build search conditions
         search_conditions = (
             Issue.title.contains(query_text) |
@@ -502,17 +661,44 @@ class PMDatabase:
             Issue.implementation.contains(query_text)
         )
 
-        query = Issue.select().where(search_conditions)
+        if include_content:
+            query = Issue.select()
+        else:
+            query = Issue.select(
+                Issue.key, Issue.title, Issue.type, Issue.status, Issue.priority,
+                Issue.module, Issue.owner, Issue.created_utc, Issue.updated_utc,
+                Project.project_id, Project.project_slug, Project.absolute_path
+            )
+        query = query.join(Project).where(search_conditions)
 
         # Exclude archived unless explicitly included
         if not include_archived:
             query = query.where(Issue.status != 'archived')
 
         if project_id:
-            query = query.join(Project).where(Project.project_id == project_id)
+            query = query.where(Project.project_id == project_id)
 
         query = query.order_by(Issue.updated_utc.desc()).limit(limit)
-        return [issue.to_rich_dict() for issue in query]
+        if include_content:
+            return [issue.to_rich_dict() for issue in query]
+
+        results = []
+        for row in query.dicts():
+            results.append({
+                'key': row['key'],
+                'title': row['title'],
+                'type': row['type'],
+                'status': row['status'],
+                'priority': row['priority'],
+                'module': row['module'],
+                'owner': row['owner'],
+                'project_id': row['project_id'],
+                'project_slug': row['project_slug'],
+                'project_path': row['absolute_path'],
+                'created_utc': row['created_utc'].isoformat() + 'Z' if isinstance(row['created_utc'], datetime) else None,
+                'updated_utc': row['updated_utc'].isoformat() + 'Z' if isinstance(row['updated_utc'], datetime) else None,
+            })
+        return results
 
     @classmethod
     def create_issue(cls, input_model) -> Issue:
@@ -553,9 +739,9 @@ class PMDatabase:
             priority=getattr(input_model, 'priority', 'P3') or "P3",
             module=getattr(input_model, "module", None),
             owner=getattr(input_model, "owner", None),
-            specification=json.dumps(spec),
-            planning=json.dumps(planning),
-            implementation=json.dumps(implementation),
+            specification=_json_dumps(spec),
+            planning=_json_dumps(planning),
+            implementation=_json_dumps(implementation),
             created_utc=now,
             updated_utc=now,
         )
@@ -570,7 +756,7 @@ class PMDatabase:
             raise ValueError(f"Issue {task_data['issue_key']} not found")
 
         # Prepare details JSON
-        details = json.dumps({
+        details = _json_dumps({
             'checklist': task_data.get('checklist', []),
             'notes': task_data.get('notes', ''),
             'time_estimate': task_data.get('time_estimate', '')
@@ -655,6 +841,53 @@ class PMDatabase:
             result.append(data)
         return result
 
+    @classmethod
+    def get_standup_bundle(cls, project_id: Optional[str], owner: str,
+                           since_utc: datetime, until_utc: datetime
+                           ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        The three reads behind a daily standup, projected to the fields the
+        report prints: the owner's worklogs in [since, until) (newest 50),
+        their in_progress issues (newest 10) and the blocked issues. Run it
+        inside one session so all three come from the same snapshot.
+        """
+        worklogs = (WorkLog
+                    .select(Issue.key.alias('issue_key'), WorkLog.activity, WorkLog.summary)
+                    .join(Issue))
+        if project_id:
+            worklogs = worklogs.join(Project).where(Project.project_id == project_id)
+        worklogs = (worklogs
+                    .where(WorkLog.agent == owner,
+                           WorkLog.timestamp_utc >= since_utc,
+                           WorkLog.timestamp_utc < until_utc)
+                    .order_by(WorkLog.timestamp_utc.desc())
+                    .limit(50)
+                    .dicts())
+
+        today = Issue.select(Issue.key, Issue.title, Issue.priority)
+        if project_id:
+            today = today.join(Project).where(Project.project_id == project_id)
+        today = (today
+                 .where(Issue.owner == owner, Issue.status == 'in_progress')
+                 .order_by(Issue.updated_utc.desc())
+                 .limit(10)
+                 .dicts())
+
+        blocked = Issue.select(Issue.key, Issue.title, Issue.planning, Issue.updated_utc)
+        if project_id:
+            blocked = blocked.join(Project).where(Project.project_id == project_id)
+        blocked = blocked.where(Issue.status == 'blocked').order_by(Issue.updated_utc.desc()).dicts()
+        blockers = []
+        for row in blocked:
+            blockers.append({
+                'key': row['key'],
+                'title': row['title'],
+                'updated_utc': row['updated_utc'].isoformat() + 'Z' if isinstance(row['updated_utc'], datetime) else None,
+                'blocker_reason': _safe_json(row['planning'], {}).get('blocker_reason'),
+            })
+
+        return list(worklogs), list(today), blockers
+
     @classmethod
     def update_issue_planning_estimate(cls, issue, effort: str, complexity: Optional[str], reasoning: Optional[str]):
         """Update issue planning with estimates"""
@@ -669,11 +902,36 @@ class PMDatabase:
                 "reasoning": reasoning
             })
             planning["estimate_notes"] = notes
-        issue.planning = json.dumps(planning)
+        issue.planning = _json_dumps(planning)
         issue.updated_utc = datetime.utcnow()
-        issue.save()
+        Issue.update(
+            planning=issue.planning,
+            updated_utc=issue.updated_utc
+        ).where(Issue.id == issue.id).execute()
         return issue
 
+    @classmethod
+    def update_issue_fields(cls, issue, **fields) -> Dict[str, Any]:
+        """
+        Write only the given columns (plus updated_utc) with one narrow
+        UPDATE, apply them to the instance and return its rich dict
+        """
+        fields['updated_utc'] = datetime.utcnow()
+        Issue.update(**fields).where(Issue.id == issue.id).execute()
+        for name, value in fields.items():
+            setattr(issue, name, value)
+        return issue.to_rich_dict()
+
+    @classmethod
+    def set_issue_branch_hint(cls, issue, branch_name: str) -> None:
+        """Record the branch name for an issue with a single narrow UPDATE"""
+        impl = _get_issue_field_json(issue, 'implementation')
+        impl["branch_hint"] = branch_name
+        Issue.update(
+            implementation=_json_dumps(impl),
+            updated_utc=datetime.utcnow()
+        ).where(Issue.id == issue.id).execute()
+
     @classmethod
     def create_task(cls, issue, title: str, assignee: Optional[str], details: Optional[Dict[str, Any]]):
         """Create task with auto-generated ID"""
@@ -686,12 +944,41 @@ class PMDatabase:
             title=title,
             status="todo",
             assignee=assignee,
-            details=json.dumps(details or {}),
+            details=_json_dumps(details or {}),
             created_utc=datetime.utcnow(),
             updated_utc=datetime.utcnow(),
         )
         return t
 
+    @classmethod
+    def create_task_for_issue_key(cls, issue_key: str, title: str, assignee: Optional[str],
+                                  details: Optional[Dict[str, Any]]) -> Optional[Task]:
+        """Create a task under issue_key in one INSERT ... SELECT, None if the issue is missing"""
+        if not cls._supports_returning:
+            issue = cls.get_issue(issue_key)
+            return cls.create_task(issue, title, assignee, details) if issue else None
+
+        now = datetime.utcnow()
+        sibling = Task.alias()
+        next_number = (sibling
+                       .select(fn.COUNT(sibling.id) + 1)
+                       .where(sibling.issue == Issue.id))
+        source = (Issue
+                  .select(Issue.id,
+                          Issue.key.concat('-T').concat(next_number),
+                          Value(title),
+                          Value("todo"),
+                          Value(assignee),
+                          Value(_json_dumps(details or {})),
+                          Value(now),
+                          Value(now))
+                  .where(Issue.key == issue_key))
+        query = Task.insert_from(source, fields=[
+            Task.issue, Task.task_id, Task.title, Task.status, Task.assignee,
+            Task.details, Task.created_utc, Task.updated_utc
+        ]).returning(Task)
+        return next(iter(query.execute()), None)
+
     @classmethod
     def get_task(cls, task_id: str) -> Optional[Task]:
         """Get task by ID"""
@@ -710,18 +997,38 @@ class PMDatabase:
         if assignee is not None:
             task.assignee = assignee
         if details is not None:
-            task.details = json.dumps(details)
+            task.details = _json_dumps(details)
         task.updated_utc = datetime.utcnow()
         task.save()
         return task
 
+    @classmethod
+    def update_task_by_id(cls, task_id: str, title=None, status=None, assignee=None, details=None) -> Optional[Task]:
+        """Update a task in one UPDATE ... RETURNING, None if the task is missing"""
+        if not cls._supports_returning:
+            task = cls.get_task(task_id)
+            return cls.update_task(task, title, status, assignee, details) if task else None
+
+        changes = {Task.updated_utc: datetime.utcnow()}
+        if title is not None:
+            changes[Task.title] = title
+        if status is not None:
+            changes[Task.status] = status
+        if assignee is not None:
+            changes[Task.assignee] = assignee
+        if details is not None:
+            changes[Task.details] = _json_dumps(details)
+        query = Task.update(changes).where(Task.task_id == task_id).returning(Task)
+        return next(iter(query.execute()), None)
+
     @classmethod
     def get_issues(cls, project_id: Optional[str] = None,
                    owner: Optional[str] = None,
                    status: Optional[str] = None,
                    priority: Optional[str] = None,
                    module: Optional[str] = None,
-                   limit: int = 1000) -> List[Dict[str, Any]]:
+                   limit: int = 1000,
+                   statuses: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
         """
         Return issues as rich dicts, optionally filtered.
         This is a dict-returning convenience wrapper used by server.py.
@@ -732,10 +1039,12 @@ class PMDatabase:
         if owner:
             query = query.where(Issue.owner == owner)
         # Exclude archived issues by default unless explicitly filtered by status
-        if not status:
-            query = query.where(Issue.status != 'archived')
         if status:
             query = query.where(Issue.status == status)
+        elif statuses:
+            query = query.where(Issue.status.in_(statuses))
+        else:
+            query = query.where(Issue.status != 'archived')
         if priority:
             query = query.where(Issue.priority == priority)
         if module:
@@ -743,6 +1052,82 @@ class PMDatabase:
         query = query.order_by(Issue.updated_utc.desc()).limit(limit)
         return [i.to_rich_dict() for i in query]
 
+    @classmethod
+    def count_issues(cls, owner: Optional[str] = None) -> int:
+        """Number of non-archived issues, optionally for one owner"""
+        query = Issue.select().where(Issue.status != 'archived')
+        if owner:
+            query = query.where(Issue.owner == owner)
+        return query.count()
+
+    @classmethod
+    def get_dependency_graph(cls, project_id: Optional[str] = None,
+                             limit: int = 1000) -> List[Dict[str, Any]]:
+        """
+        The key/title/status/dependencies slice of get_issues() that
+        build_dependency_index() and analyze_dependencies() read, without
+        hydrating full rich dicts. Same archived filter, order and limit.
+        """
+        query = Issue.select(Issue.key, Issue.title, Issue.status, Issue.planning)
+        if project_id:
+            query = query.join(Project).where(Project.project_id == project_id)
+        query = (query
+                 .where(Issue.status != 'archived')
+                 .order_by(Issue.updated_utc.desc())
+                 .limit(limit)
+                 .dicts())
+        return [_dependency_view(row) for row in query]
+
+    @classmethod
+    def get_issue_statuses(cls, project_id: Optional[str], keys) -> Dict[str, str]:
+        """
+        Status by key for the given issues, for readiness checks that only
+        need to know whether each dependency is done. Archived issues are
+        left out, as in get_dependency_graph().
+        """
+        if not keys:
+            return {}
+        query = Issue.select(Issue.key, Issue.status)
+        if project_id:
+            query = query.join(Project).where(Project.project_id == project_id)
+        query = query.where(Issue.key.in_(list(keys)), Issue.status != 'archived')
+        return dict(query.tuples())
+
+    @classmethod
+    def get_dependency_context(cls, project_id: Optional[str], issue_key: str,
+                               dependency_keys: List[str]) -> List[Dict[str, Any]]:
+        """
+        The issues analyze_dependencies() needs for one issue: the ones it
+        depends on plus the ones whose planning mentions its key. The text
+        match only narrows the scan - analyze_dependencies() re-checks the
+        parsed dependency lists. Same archived filter and order as get_issues().
+        """
+        condition = Issue.planning.contains(f'"{issue_key}"')
+        if dependency_keys:
+            condition = condition | Issue.key.in_(dependency_keys)
+        query = Issue.select(Issue.key, Issue.title, Issue.status, Issue.planning)
+        if project_id:
+            query = query.join(Project).where(Project.project_id == project_id)
+        query = (query
+                 .where(Issue.status != 'archived', condition)
+                 .order_by(Issue.updated_utc.desc())
+                 .dicts())
+        return [_dependency_view(row) for row in query]
+
+    @classmethod
+    def get_dependent_issue_keys(cls, project: Project, issue_key: str) -> List[str]:
+        """
+        Keys of issues in the project whose planning lists issue_key as a
+        dependency. The text match narrows the scan in SQL; the parsed
+        dependency list confirms each candidate.
+        """
+        query = (Issue.select(Issue.key, Issue.planning)
+                 .where((Issue.project == project) &
+                        Issue.planning.contains(f'"{issue_key}"'))
+                 .tuples())
+        return [key for key, planning in query
+                if issue_key in _safe_json(planning, {}).get('dependencies', [])]
+
     @classmethod
     def create_or_update_issue(cls, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -789,9 +1174,9 @@ class PMDatabase:
             for f in ("title", "type", "status", "priority", "module", "owner", "external_id"):
                 if f in data and data[f] is not None:
                     setattr(issue, f, data[f])
-            issue.specification = json.dumps(spec)
-            issue.planning = json.dumps(plan)
-            issue.implementation = json.dumps(impl)
+            issue.specification = _json_dumps(spec)
+            issue.planning = _json_dumps(plan)
+            issue.implementation = _json_dumps(impl)
             issue.updated_utc = now
             issue.save()
         else:
@@ -810,9 +1195,9 @@ class PMDatabase:
                 module=data.get("module"),
                 owner=data.get("owner"),
                 external_id=data.get("external_id"),
-                specification=json.dumps(spec),
-                planning=json.dumps(plan),
-                implementation=json.dumps(impl),
+                specification=_json_dumps(spec),
+                planning=_json_dumps(plan),
+                implementation=_json_dumps(impl),
                 created_utc=now,
                 updated_utc=now,
             )
@@ -840,8 +1225,8 @@ class PMDatabase:
             timestamp_utc=datetime.utcnow(),
             activity=data["activity"],
             summary=data["summary"],
-            artifacts=json.dumps(data.get("artifacts") or []),
-            context=json.dumps(data.get("context") or {}),
+            artifacts=_json_dumps(data.get("artifacts") or []),
+            context=_json_dumps(data.get("context") or {}),
         )
         return wl.to_dict()
 
@@ -857,30 +1242,111 @@ class PMDatabase:
             timestamp_utc=datetime.utcnow(),
             activity=activity,
             summary=summary,
-            artifacts=json.dumps(artifacts or []),
-            context=json.dumps(context or {}),
+            artifacts=_json_dumps(artifacts or []),
+            context=_json_dumps(context or {}),
         )
         return wl
 
+    @classmethod
+    def bulk_reassign_module(cls, project: Project, old_module: str, new_module: str) -> int:
+        """
+        Move the project's non-archived issues from old_module to new_module
+        with one UPDATE; returns the number of issues changed
+        """
+        return (Issue
+                .update(module=new_module)
+                .where((Issue.project == project) &
+                       (Issue.module == old_module) &
+                       (Issue.status != 'archived'))
+                .execute())
+
+    @classmethod
+    def get_module_issue_counts(cls, project_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Non-archived issue counts per module, as
+        {module: {'total', 'by_status', 'by_priority'}}, from one GROUP BY
+        """
+        rows = (Issue
+                .select(Issue.module, Issue.status, Issue.priority,
+                        fn.COUNT(Issue.id).alias('count'))
+                .join(Project)
+                .where((Project.project_id == project_id) &
+                       Issue.module.is_null(False) &
+                       (Issue.status != 'archived'))
+                .group_by(Issue.module, Issue.status, Issue.priority)
+                .tuples())
+        counts: Dict[str, Dict[str, Any]] = {}
+        for module, status, priority, count in rows:
+            bucket = counts.get(module)
+            if bucket is None:
+                bucket = counts[module] = {'total': 0, 'by_status': {}, 'by_priority': {}}
+            bucket['total'] += count
+            bucket['by_status'][status] = bucket['by_status'].get(status, 0) + count
+            bucket['by_priority'][priority] = bucket['by_priority'].get(priority, 0) + count
+        return counts
+
+    @classmethod
+    def _save_project_metadata(cls, project: Project, metadata: Dict[str, Any]) -> None:
+        """Write back just the metadata column (plus updated_utc)"""
+        project.metadata = _json_dumps(metadata)
+        project.updated_utc = datetime.utcnow()
+        project.save(only=[Project.metadata, Project.updated_utc])
+
+    @classmethod
+    def append_project_submodule(cls, project: Project, submodule: Dict[str, Any]) -> None:
+        """Append one entry to the project's metadata['submodules']"""
+        with db_proxy.atomic():
+            # Re-read inside the transaction so a concurrent edit is not lost
+            project.metadata = Project.select(Project.metadata).where(Project.id == project.id).scalar()
+            metadata = project.get_metadata()
+            metadata.setdefault('submodules', []).append(submodule)
+            cls._save_project_metadata(project, metadata)
+
+    @classmethod
+    def remove_project_submodule(cls, project: Project, name: str) -> int:
+        """
+        Drop the submodule called `name` from the project's metadata,
+        matched by name on a copy read inside the transaction. Returns
+        the number of entries removed
+        """
+        with db_proxy.atomic():
+            project.metadata = Project.select(Project.metadata).where(Project.id == project.id).scalar()
+            metadata = project.get_metadata()
+            submodules = metadata.get('submodules', [])
+            remaining = [sub for sub in submodules if sub.get('name') != name]
+            if len(remaining) == len(submodules):
+                return 0
+            metadata['submodules'] = remaining
+            cls._save_project_metadata(project, metadata)
+            return len(submodules) - len(remaining)
+
     @classmethod
     def project_metrics(cls, project, include_submodule_breakdown=False):
         """Calculate project metrics with optional submodule breakdown"""
-        issues = list(project.issues)
+        # One GROUP BY over the four bucket columns instead of loading every issue row
+        rows = (Issue
+                .select(Issue.status, Issue.priority, Issue.module, Issue.type,
+                        fn.COUNT(Issue.id).alias('count'))
+                .where(Issue.project == project)
+                .group_by(Issue.status, Issue.priority, Issue.module, Issue.type)
+                .tuples())
+        total = 0
         status_counts = {}
         priority_counts = {}
         module_counts = {}
         submodule_metrics = {}
 
-        for i in issues:
-            status_counts[i.status] = status_counts.get(i.status, 0) + 1
-            priority_counts[i.priority] = priority_counts.get(i.priority, 0) + 1
-            if i.module:
-                module_counts[i.module] = module_counts.get(i.module, 0) + 1
+        for status, priority, module, issue_type, count in rows:
+            total += count
+            status_counts[status] = status_counts.get(status, 0) + count
+            priority_counts[priority] = priority_counts.get(priority, 0) + count
+            if module:
+                module_counts[module] = module_counts.get(module, 0) + count
 
                 # If this module is a submodule, track detailed metrics
                 if include_submodule_breakdown:
-                    if i.module not in submodule_metrics:
-                        submodule_metrics[i.module] = {
+                    if module not in submodule_metrics:
+                        submodule_metrics[module] = {
                             "total": 0,
                             "by_status": {},
                             "by_priority": {},
@@ -889,15 +1355,15 @@ class PMDatabase:
                             "blocked_count": 0,
                             "completion_rate": 0.0
                         }
-                    sub = submodule_metrics[i.module]
-                    sub["total"] += 1
-                    sub["by_status"][i.status] = sub["by_status"].get(i.status, 0) + 1
-                    sub["by_priority"][i.priority] = sub["by_priority"].get(i.priority, 0) + 1
-                    sub["by_type"][i.type] = sub["by_type"].get(i.type, 0) + 1
-                    if i.status == "in_progress":
-                        sub["in_progress_count"] += 1
-                    elif i.status == "blocked":
-                        sub["blocked_count"] += 1
+                    sub = submodule_metrics[module]
+                    sub["total"] += count
+                    sub["by_status"][status] = sub["by_status"].get(status, 0) + count
+                    sub["by_priority"][priority] = sub["by_priority"].get(priority, 0) + count
+                    sub["by_type"][issue_type] = sub["by_type"].get(issue_type, 0) + count
+                    if status == "in_progress":
+                        sub["in_progress_count"] += count
+                    elif status == "blocked":
+                        sub["blocked_count"] += count
 
         # Calculate completion rates for submodules
         if include_submodule_breakdown:
@@ -906,17 +1372,21 @@ class PMDatabase:
                 if metrics["total"] > 0:
                     metrics["completion_rate"] = round(done_count / metrics["total"] * 100, 1)
 
+        # Issue and task come back in the same row, not one lazy load per worklog
         recent_work = (WorkLog
-                      .select()
+                      .select(WorkLog, Issue.key.alias('issue_key'), Task.task_id.alias('task_key'))
                       .join(Issue)
+                      .switch(WorkLog)
+                      .join(Task, JOIN.LEFT_OUTER)
                       .where(Issue.project == project)
                       .order_by(WorkLog.timestamp_utc.desc())
-                      .limit(20))
+                      .limit(20)
+                      .objects())
         recent = []
         for w in recent_work:
             recent.append({
-                "issue_key": w.issue.key,
-                "task_id": w.task.task_id if w.task else None,
+                "issue_key": w.issue_key,
+                "task_id": w.task_key,
                 "agent": w.agent,
                 "activity": w.activity,
                 "summary": w.summary,
@@ -925,7 +1395,7 @@ class PMDatabase:
 
         result = {
             "counts": {
-                "total": len(issues),
+                "total": total,
                 "by_status": status_counts,
                 "by_priority": priority_counts,
                 "by_module": module_counts,
@@ -1014,11 +1484,53 @@ class PMDatabase:
         return f"{prefix}-{date_part}-{max_num + 1:03d}"
 
 # Context manager for database operations
+# Per-thread nesting depth of DatabaseSession blocks
+_session_state = threading.local()
+
 class DatabaseSession:
-    """Context manager for database operations"""
+    """
+    Context manager that checks a pooled connection out and back in.
+    Nested sessions on one thread share the outermost session's connection.
+    """
+    def __enter__(self):
+        depth = getattr(_session_state, 'depth', 0)
+        if depth == 0:
+            PMDatabase.connect()
+        _session_state.depth = depth + 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _session_state.depth -= 1
+        if _session_state.depth == 0:
+            PMDatabase.close()
+
+class ReadOnlyDatabaseSession(DatabaseSession):
+    """
+    DatabaseSession for tools that only read: every query runs inside one
+    deferred transaction, so the tool sees a single consistent snapshot and
+    takes the read lock once instead of once per statement. The connection
+    is query_only for the session and the transaction is rolled back on
+    exit, so a stray write fails loudly instead of upgrading the snapshot.
+    Project auto-init runs in strict_project_scope, before the tool opens
+    this session.
+    """
     def __enter__(self):
-        PMDatabase.connect()
+        super().__enter__()
+        # Inside an outer transaction there is nothing of ours to roll back
+        self._owns_txn = db_proxy.transaction_depth() == 0
+        if self._owns_txn:
+            db_proxy.pragma('query_only', 1)
+            self._txn = db_proxy.transaction()
+            self._txn.__enter__()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        PMDatabase.close()
\ No newline at end of file
+        try:
+            if self._owns_txn:
+                try:
+                    db_proxy.pop_transaction()
+                    self._txn.rollback(False)
+                finally:
+                    db_proxy.pragma('query_only', 0)
+        finally:
+            super().__exit__(exc_type, exc_val, exc_tb)
\ No newline at end of file
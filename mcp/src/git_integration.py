@@ -1,11 +1,34 @@
 """Git integration helpers with security"""
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from utils import run_git
 
 def git_status(repo_path: str) -> Dict[str, Any]:
     """Return porcelain git status for parsable output"""
     return run_git(repo_path, ["status", "--porcelain=v1"])
 
+def _parse_branch_header(header: str) -> Optional[str]:
+    """Extract the branch name from a porcelain '## ...' status header"""
+    for prefix in ("No commits yet on ", "Initial commit on "):
+        if header.startswith(prefix):
+            return header[len(prefix):]
+    if header.startswith("HEAD (no branch)"):
+        return "HEAD"  # detached, same as rev-parse --abbrev-ref
+    return header.split("...", 1)[0].split(" ", 1)[0] or None
+
+def git_status_with_branch(repo_path: str) -> Dict[str, Any]:
+    """Porcelain status and current branch from a single git process.
+
+    Same shape as git_status(), with the '## branch' header removed from
+    'out' and the parsed name (or None) under 'branch'.
+    """
+    result = run_git(repo_path, ["status", "--porcelain=v1", "--branch"])
+    result["branch"] = None
+    if result["rc"] == 0 and result["out"].startswith("## "):
+        header, _, entries = result["out"].partition("\n")
+        result["branch"] = _parse_branch_header(header[3:])
+        result["out"] = entries
+    return result
+
 def git_current_branch(repo_path: str) -> Dict[str, Any]:
     """Get current branch name"""
     return run_git(repo_path, ["rev-parse", "--abbrev-ref", "HEAD"])
@@ -1,6 +1,6 @@
 """Pydantic models for PM MCP Server tools with comprehensive validation"""
 from typing import Optional, List, Dict, Any, Literal, Union
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 import json
 
@@ -378,7 +378,8 @@ class LogWorkInput(BaseModel):
         description="Key technical or architectural decisions made"
     )
 
-    @validator("artifacts", pre=True)
+    @field_validator("artifacts", mode="before")
+    @classmethod
     def _normalize_artifacts(cls, v):
         """Handle flexible artifact input"""
         if v is None:
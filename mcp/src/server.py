@@ -5,12 +5,16 @@ Production-ready implementation with all fixes applied
 """
 import os
 import sys
-import asyncio
+import functools
+import importlib.util
 import json
+import logging
+import time
 import traceback
+import uuid
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Optional, Sequence, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -21,16 +25,113 @@ except ImportError:
     print("❌ Error: MCP library not installed. Run 'pip install mcp' first.")
     sys.exit(1)
 
+# requests is only used by pm_register_project, so it is imported on first
+# use (see _http()) rather than on every server start
+_REQUESTS_OK = importlib.util.find_spec("requests") is not None
+
+# Optional fast JSON codec for HTTP payloads; stdlib json is the fallback
+try:
+    import orjson
+    _json_dumps_bytes = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _json_loads = json.loads
+
 from config import Config
-from database import PMDatabase, DatabaseSession, _get_issue_field_json, Task, WorkLog
+from database import (PMDatabase, DatabaseSession, ReadOnlyDatabaseSession, _get_issue_field_json,
+                      _json_dumps, Project, Task, WorkLog, db_proxy, ACTIONABLE_STATUSES)
 from models import *
 from utils import *
-from git_integration import git_status, git_current_branch, git_push_current
+from git_integration import git_status_with_branch, git_push_current
 from docs_content import DOCS_CONTENT
 from workflow_content import WORKFLOW_CONTENT
+from reminder_content import REMINDER_CONTENT
 
 # Initialize MCP server
 mcp = FastMCP("pm-server")
+logger = logging.getLogger("pm-server")
+
+# (connect, read) timeouts for web UI calls: an unreachable web UI fails fast
+# instead of holding the tool call for the full read budget.
+_HTTP_TIMEOUT = (3.05, 10)
+_HTTP_SESSION = None
+
+def _http():
+    """Shared HTTP session for web UI calls - keeps connections alive across tool calls"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+# Sort rank for issue priorities (unknown priorities sort last)
+PRIORITY_ORDER = {'P1': 1, 'P2': 2, 'P3': 3, 'P4': 4, 'P5': 5}
+
+# Static hints returned with every pm_reminder response
+_REMINDER_HINTS = (
+    "Call pm_reminder periodically to maintain PM discipline",
+    "Use pm_docs for detailed command reference",
+    "Always prefer PM tools over direct git/file operations"
+)
+
+# pm_get_issue next-step hint templates by issue status
+_ISSUE_HINTS_BY_STATUS = {
+    'proposed': (
+        "pm_estimate --issue-key {key} to add effort estimates",
+        "pm_refine_issue --issue-key {key} to refine requirements",
+        "pm_start_work --issue-key {key} to begin implementation",
+    ),
+    'in_progress': (
+        "pm_log_work --issue-key {key} to track current activity",
+        "pm_create_task --issue-key {key} to break down work",
+        "pm_commit --issue-key {key} to save changes",
+    ),
+    'review': (
+        "pm_push_branch --issue-key {key} --create-pr to create pull request",
+        "pm_update_status --issue-key {key} --status done when approved",
+    ),
+}
+
+# Issue status transitions allowed by pm_update_status, in the order they
+# are reported back to the caller
+_VALID_STATUS_TRANSITIONS = {
+    'proposed': ('in_progress', 'canceled'),
+    'in_progress': ('blocked', 'review', 'canceled'),
+    'blocked': ('in_progress', 'canceled'),
+    'review': ('in_progress', 'done', 'canceled'),
+    'done': ('in_progress',),  # Can reopen
+    'canceled': ('proposed',),  # Can revive
+}
+_STATUS_TRANSITION_HINTS = {
+    status: (f"Valid transitions from {status}: {', '.join(targets)}",)
+    for status, targets in _VALID_STATUS_TRANSITIONS.items()
+}
+
+# Task statuses accepted by pm_update_task (see UpdateTaskInput.status)
+_VALID_TASK_STATUSES = frozenset({"todo", "doing", "blocked", "review", "done"})
+
+# Static hint tuples for tools whose hints never vary (ok/err copy nothing)
+_ESTIMATE_ERROR_HINTS = ("Check issue exists", "Verify estimate format (e.g., '2-3 days', '1 week')")
+_CREATE_TASK_ERROR_HINTS = ("Check issue exists", "Verify task doesn't already exist")
+_UPDATE_TASK_ERROR_HINTS = ("Check task exists", "Verify status is valid (todo, doing, blocked, review, done)")
+_GIT_STATUS_ERROR_HINTS = ("Check if you're in a git repository", "Verify git is installed")
+_PUSH_BRANCH_HINTS = ("Create a PR in your VCS host if desired.",)
+_PUSH_BRANCH_ERROR_HINTS = ("Check remote exists", "Verify git credentials are configured")
+_REGISTER_NO_PROJECT_HINTS = ("Run pm_init_project first", "Use pm_list_projects to see available projects")
+_REGISTER_PROJECT_MISSING_HINTS = ("Run pm_init_project first",)
+_REGISTER_NO_REQUESTS_HINTS = ("Install requests: pip install requests", "Or register manually via web UI")
+_REGISTER_ERROR_HINTS = ("Check database connectivity", "Verify project exists")
+
+# Row templates for the plain-text standup report
+_STANDUP_WORKLOG_LINE = "- {issue_key}: {summary}".format_map
+_STANDUP_TODAY_LINE = "- {key}: {title} ({priority})".format_map
+_STANDUP_BLOCKER_LINE = "- {key}: {title}".format_map
 
 # Ensure database is initialized
 PMDatabase.initialize()
@@ -41,7 +142,6 @@ from command_config import is_command_enabled as _is_command_enabled
 
 def conditional_mcp_tool(func):
     """Only register as MCP tool if command is enabled - prevents context bloat"""
-    import functools
     command_name = func.__name__
 
     @functools.wraps(func)
@@ -68,7 +168,6 @@ def conditional_mcp_tool(func):
 
 def log_command_usage_decorator(func):
     """Decorator to log MCP command usage for analytics and enforce command filtering"""
-    import functools
     command_name = func.__name__
 
     @functools.wraps(func)
@@ -120,22 +219,17 @@ def _auto_initialize_project() -> Optional[str]:
 
         if is_git_repo or has_project_files:
             # Auto-initialize project
-            from database import Project
-            from datetime import datetime
-            import json
-
             with DatabaseSession():
                 project_name = cwd.name
                 project_slug = project_name.lower().replace(' ', '-')
 
                 # Check if already exists
-                existing = [p for p in PMDatabase.get_all_projects()
-                          if Path(p.absolute_path).resolve() == cwd]
+                existing = PMDatabase.get_project_by_path(cwd)
                 if existing:
-                    return existing[0].project_id
+                    return existing.project_id
 
                 # Create new project
-                project_id = f"pn_{abs(hash(str(cwd))) % (10**16)}"
+                project_id = stable_project_id(cwd)
 
                 # Detect submodules
                 submodules = []
@@ -166,6 +260,7 @@ def _auto_initialize_project() -> Optional[str]:
                     updated_utc=datetime.utcnow(),
                 )
 
+                invalidate_project_caches()
                 print(f"✅ Auto-initialized project: {project_slug} ({project_id})")
                 return proj.project_id
     except Exception as e:
@@ -181,15 +276,9 @@ def _auto_project_id() -> Optional[str]:
 
     # 2. Try to find matching existing project
     try:
-        cwd = Path.cwd().resolve()
-        for p in PMDatabase.get_all_projects():
-            try:
-                p_path = Path(p.absolute_path).resolve()
-                # exact repo or subdir
-                if cwd == p_path or str(cwd).startswith(str(p_path) + os.sep):
-                    return p.project_id
-            except Exception:
-                continue
+        pid = project_id_for_cwd(PMDatabase, os.getcwd())
+        if pid:
+            return pid
     except Exception:
         pass
 
@@ -204,36 +293,123 @@ def _auto_project_id() -> Optional[str]:
     return projects[0].project_id if projects else None
 
 def _require_project_id(explicit: Optional[str]) -> Optional[str]:
-    """Get project ID with fallback to auto-detection."""
-    return explicit or _auto_project_id()
+    """Get project ID, reusing the strict_project_scope resolution when inside a scoped tool."""
+    return explicit or scoped_project_id() or _auto_project_id()
+
+# First-project fallback for get_default_project_id(), looked up once per
+# process. Cleared by invalidate_project_caches() when projects are created.
+_default_project_id_cache: Optional[str] = None
 
 def get_default_project_id() -> Optional[str]:
     """Get default project ID from config or first available"""
+    global _default_project_id_cache
     if Config.DEFAULT_PROJECT_ID:
         return Config.DEFAULT_PROJECT_ID
+    if _default_project_id_cache is not None:
+        return _default_project_id_cache
 
     try:
         with DatabaseSession():
             projects = PMDatabase.get_all_projects()
             if projects:
                 # projects is now a list of models, not dicts
-                return projects[0].project_id
+                _default_project_id_cache = projects[0].project_id
+                return _default_project_id_cache
     except Exception:
         pass
     return None
 
+def invalidate_project_caches() -> None:
+    """Drop cached project lookups so the next call re-reads the DB"""
+    global _default_project_id_cache
+    _default_project_id_cache = None
+    clear_project_path_cache()
+    _working_path_cache.clear()
+
 # Use standardized response functions from utils
 # Compatibility shim for migration period
 def standard_response(success: bool, message: str, data: Optional[Dict[str, Any]] = None,
-                     hints: Optional[List[str]] = None) -> Dict[str, Any]:
+                     hints: Optional[Sequence[str]] = None) -> Dict[str, Any]:
     """Compatibility shim - use ok() and err() for new code"""
     if success:
         return ok(message, data, hints)
     else:
         return err(message, data, hints)
 
+# Serialized projects keyed by (project_id, updated_utc). Every project write
+# bumps updated_utc, so a stale entry is never hit. Treat the dicts as read-only.
+_PROJECT_DICT_CACHE_SIZE = 128
+_project_dict_cache: Dict[tuple, Dict[str, Any]] = {}
+
+def _project_dict_cached(project) -> Dict[str, Any]:
+    """PMDatabase._project_to_dict() memoized on the project's version"""
+    key = (project.project_id, project.updated_utc)
+    project_dict = _project_dict_cache.get(key)
+    if project_dict is None:
+        if len(_project_dict_cache) >= _PROJECT_DICT_CACHE_SIZE:
+            _project_dict_cache.clear()
+        project_dict = _project_dict_cache[key] = PMDatabase._project_to_dict(project)
+    return project_dict
+
+# Git working directory per (project version, module). A submodule can gain
+# its own .git without any project write, so entries also expire.
+_WORKING_PATH_TTL = 60.0
+_working_path_cache: Dict[tuple, Tuple[float, Path]] = {}
+
+def _resolve_working_path(project, module: Optional[str]) -> Path:
+    """Directory git tools run in for an issue: its submodule's own repo
+    if it has one, otherwise the project root"""
+    project_path = Path(project.absolute_path)
+    if not module:
+        return project_path
+
+    key = (project.project_id, project.updated_utc, module)
+    now = time.monotonic()
+    cached = _working_path_cache.get(key)
+    if cached is not None and now - cached[0] < _WORKING_PATH_TTL:
+        return cached[1]
+
+    working_path = project_path
+    for submodule in project.submodules:
+        if submodule['name'] == module:
+            submodule_path = project_path / submodule['path']
+            if (submodule_path / '.git').exists():
+                # Submodule has its own git repo
+                working_path = submodule_path
+            break
+
+    if len(_working_path_cache) >= _PROJECT_DICT_CACHE_SIZE:
+        _working_path_cache.clear()
+    _working_path_cache[key] = (now, working_path)
+    return working_path
+
+# Frames kept in a PM_DEBUG traceback returned to the client
+_TRACEBACK_FRAMES = 20
+
+def _error_details(e: Exception) -> Dict[str, Any]:
+    """Log a failed tool call and build its error_details payload.
+
+    Must be called from inside an except block. The traceback always goes to
+    the log; it is only formatted into the response when Config.DEBUG is set.
+    The short err_id ties the client-side error to its log entry.
+    """
+    err_id = uuid.uuid4().hex[:8]
+    logger.exception("Tool call failed err_id=%s: %s", err_id, e)
+    details = {"error": str(e), "type": type(e).__name__, "err_id": err_id}
+    if Config.DEBUG:
+        # Innermost frames only; the exception chain is already in the log
+        details["traceback"] = traceback.format_exc(limit=-_TRACEBACK_FRAMES, chain=False)
+    return details
+
 # =============== Discovery Tools ===============
 
+# Static payloads for pm_docs / pm_workflow, built once; only the response
+# timestamp changes per call. Shared across calls, so never mutate them.
+_DOCS_DATA = {"content": DOCS_CONTENT}
+_DOCS_HINTS = ("Use pm_workflow for methodology and best practices",)
+_WORKFLOW_DATA = {"content": WORKFLOW_CONTENT}
+_WORKFLOW_HINTS = ("Follow this methodology throughout your development session",)
+
 @conditional_mcp_tool
 def pm_docs(input: PMDocsInput) -> Dict[str, Any]:
     """
@@ -242,15 +418,12 @@ def pm_docs(input: PMDocsInput) -> Dict[str, Any]:
     troubleshooting, and best practices.
     """
     try:
-        return ok("Complete PM Documentation", {
-            "content": DOCS_CONTENT
-        }, hints=["Use pm_workflow for methodology and best practices"])
+        return ok("Complete PM Documentation", _DOCS_DATA, hints=_DOCS_HINTS)
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to get documentation: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check system configuration"]
         )
 
@@ -262,15 +435,12 @@ def pm_workflow(input: PMWorkflowInput) -> Dict[str, Any]:
     guidance on how to work effectively with the PM system.
     """
     try:
-        return ok("PM Workflow Methodology", {
-            "content": WORKFLOW_CONTENT
-        }, hints=["Follow this methodology throughout your development session"])
+        return ok("PM Workflow Methodology", _WORKFLOW_DATA, hints=_WORKFLOW_HINTS)
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to get workflow methodology: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check system configuration"]
         )
 
@@ -282,7 +452,7 @@ def pm_status(input: PMStatusInput) -> Dict[str, Any]:
     and current work distribution. Essential for understanding project health.
     """
     try:
-        with DatabaseSession():
+        with ReadOnlyDatabaseSession():
             pid = _require_project_id(input.project_id)
             if not pid:
                 # Provide helpful guidance in global mode
@@ -299,11 +469,13 @@ def pm_status(input: PMStatusInput) -> Dict[str, Any]:
             if not project:
                 return err(f"Project not found: {pid}", {})
 
-            # Convert project model to dict
-            proj_dict = PMDatabase._project_to_dict(project)
+            # Convert project model to dict; its parsed metadata supplies the submodules
+            proj_dict = _project_dict_cached(project)
+            submodules = proj_dict['metadata'].get('submodules') or []
 
-            # Get project metrics with submodule breakdown if project has submodules
-            has_submodules = bool(project.submodules)
+            # Get project metrics with submodule breakdown if project has submodules.
+            # project_metrics() buckets every module from one GROUP BY query.
+            has_submodules = bool(submodules)
             metrics = PMDatabase.project_metrics(project, include_submodule_breakdown=has_submodules)
 
             data = {
@@ -314,10 +486,11 @@ def pm_status(input: PMStatusInput) -> Dict[str, Any]:
             # Add submodule summary if applicable
             if has_submodules and "submodule_metrics" in metrics:
                 submodule_summary = []
-                for submodule in project.submodules:
+                submodule_metrics = metrics["submodule_metrics"]
+                for submodule in submodules:
                     sub_name = submodule["name"]
-                    if sub_name in metrics["submodule_metrics"]:
-                        sub_data = metrics["submodule_metrics"][sub_name]
+                    sub_data = submodule_metrics.get(sub_name)
+                    if sub_data:
                         submodule_summary.append({
                             "name": sub_name,
                             "path": submodule.get("path", ""),
@@ -337,11 +510,10 @@ def pm_status(input: PMStatusInput) -> Dict[str, Any]:
 
             return ok("Project status with submodule breakdown", data, hints=hints)
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to get project status: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check database connectivity", "Verify project exists"]
         )
 
@@ -353,7 +525,7 @@ def pm_list_issues(input: ListIssuesInput) -> Dict[str, Any]:
     Returns structured issue data suitable for analysis and planning.
     """
     try:
-        with DatabaseSession():
+        with ReadOnlyDatabaseSession():
             pid = _require_project_id(input.project_id)
             if not pid:
                 if _is_global_mode():
@@ -364,13 +536,13 @@ def pm_list_issues(input: ListIssuesInput) -> Dict[str, Any]:
             # If submodule is specified, use it as the module filter
             module_filter = input.submodule if input.submodule else input.module
 
-            issues = PMDatabase.find_issues(pid,
-                                            status=input.status, priority=input.priority,
-                                            module=module_filter, q=None, query=None)
+            issues = PMDatabase.find_issue_dicts(pid,
+                                                 status=input.status, priority=input.priority,
+                                                 module=module_filter, q=None, query=None)
 
             # Add submodule info to response if filtering by submodule
             response_data = {
-                "issues": [i.to_rich_dict() for i in issues],
+                "issues": issues,
                 "count": len(issues)
             }
             if input.submodule:
@@ -378,11 +550,10 @@ def pm_list_issues(input: ListIssuesInput) -> Dict[str, Any]:
 
             return ok(f"Found {len(issues)} issues", response_data)
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to list issues: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check database connectivity", "Verify project exists"]
         )
 
@@ -395,7 +566,7 @@ def pm_get_issue(input: GetIssueInput) -> Dict[str, Any]:
     FIXED: Uses Peewee models instead of raw SQL queries.
     """
     try:
-        with DatabaseSession():
+        with ReadOnlyDatabaseSession():
             if input.include_tasks or input.include_worklogs:
                 # Get issue with all relations using Peewee models
                 issue_data = PMDatabase.get_issue_with_relations(input.issue_key)
@@ -406,9 +577,9 @@ def pm_get_issue(input: GetIssueInput) -> Dict[str, Any]:
                         hints=["Use pm_search_issues to find issues", "Check issue key format"]
                     )
 
-                result_data = {
-                    "issue": issue_data['issue']
-                }
+                issue_view = issue_data['issue']
+                issue_proj_id = issue_data['project']['project_id']
+                result_data = {"issue": issue_view}
 
                 if input.include_tasks:
                     result_data["tasks"] = issue_data['tasks']
@@ -427,45 +598,21 @@ def pm_get_issue(input: GetIssueInput) -> Dict[str, Any]:
                         success=False,
                         message=f"Issue {input.issue_key} not found in current project"
                     )
-                result_data = {"issue": PMDatabase._issue_to_dict(issue)}
+                issue_view = PMDatabase._issue_to_dict(issue)
+                issue_proj_id = issue_view.get('project_id')
+                result_data = {"issue": issue_view}
 
             # Add dependency analysis if requested
             if input.include_dependencies:
-                # Get project_id - it could be in different places depending on the path taken
-                issue_proj_id = None
-                # First try direct project_id on issue
-                if 'issue' in result_data:
-                    issue_proj_id = result_data['issue'].get('project_id')
-                # Then try separate project object
-                if not issue_proj_id and 'project' in result_data:
-                    issue_proj_id = result_data['project'].get('project_id')
-                # Finally fall back to current scope
-                if not issue_proj_id:
-                    issue_proj_id = _require_project_id(None)
-                all_issues = PMDatabase.get_issues(project_id=issue_proj_id, limit=1000)
-                deps = analyze_dependencies(result_data['issue'], all_issues)
-                result_data["dependencies"] = deps
+                related = PMDatabase.get_dependency_context(
+                    issue_proj_id or _require_project_id(None),
+                    issue_view['key'], issue_view.get('dependencies', [])
+                )
+                result_data["dependencies"] = analyze_dependencies(issue_view, related)
 
             # Generate contextual next steps
-            issue = result_data['issue']
-            hints = []
-            if issue['status'] == 'proposed':
-                hints.extend([
-                    f"pm_estimate --issue-key {issue['key']} to add effort estimates",
-                    f"pm_refine_issue --issue-key {issue['key']} to refine requirements",
-                    f"pm_start_work --issue-key {issue['key']} to begin implementation"
-                ])
-            elif issue['status'] == 'in_progress':
-                hints.extend([
-                    f"pm_log_work --issue-key {issue['key']} to track current activity",
-                    f"pm_create_task --issue-key {issue['key']} to break down work",
-                    f"pm_commit --issue-key {issue['key']} to save changes"
-                ])
-            elif issue['status'] == 'review':
-                hints.extend([
-                    f"pm_push_branch --issue-key {issue['key']} --create-pr to create pull request",
-                    f"pm_update_status --issue-key {issue['key']} --status done when approved"
-                ])
+            hints = [t.format(key=issue_view['key'])
+                     for t in _ISSUE_HINTS_BY_STATUS.get(issue_view['status'], ())]
 
             return standard_response(
                 success=True,
@@ -477,11 +624,10 @@ def pm_get_issue(input: GetIssueInput) -> Dict[str, Any]:
     except ScopeError as se:
         return err(str(se))
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to get issue: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check database connectivity", "Verify issue key format"]
         )
 
@@ -492,20 +638,15 @@ def pm_search_issues(input: SearchIssuesInput) -> Dict[str, Any]:
     Searches titles, descriptions, and all rich content fields.
     """
     try:
-        with DatabaseSession():
+        with ReadOnlyDatabaseSession():
             issues = PMDatabase.search_issues(
                 query_text=input.query,
                 project_id=input.project_id,
                 limit=input.limit,
-                include_archived=input.include_archived
+                include_archived=input.include_archived,
+                include_content=input.include_content
             )
 
-            # If not including content, strip heavy fields for performance
-            if not input.include_content:
-                for issue in issues:
-                    issue.pop('description', None)
-                    issue.pop('technical_approach', None)
-
             return standard_response(
                 success=True,
                 message=f"Found {len(issues)} issues matching '{input.query}'{' (including archived)' if input.include_archived else ''}",
@@ -526,6 +667,7 @@ def pm_search_issues(input: SearchIssuesInput) -> Dict[str, Any]:
         return standard_response(
             success=False,
             message=f"Search failed: {type(e).__name__}",
+            data={"error_details": _error_details(e)},
             hints=["Check database connectivity", "Try simpler search terms"]
         )
 
@@ -536,14 +678,14 @@ def pm_list_projects() -> Dict[str, Any]:
     Shows project metadata and basic statistics.
     """
     try:
-        with DatabaseSession():
+        with ReadOnlyDatabaseSession():
             projects = PMDatabase.get_all_projects()
             # Convert models to dicts
             project_list = []
             cwd = Path.cwd().resolve()
 
             for p in projects:
-                p_dict = PMDatabase._project_to_dict(p)
+                p_dict = dict(_project_dict_cached(p))
                 # Mark if this is the current project
                 try:
                     p_path = Path(p.absolute_path).resolve()
@@ -563,14 +705,16 @@ def pm_list_projects() -> Dict[str, Any]:
 
             return ok(f"Found {len(projects)} projects", data, hints)
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to list projects: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check database connectivity", "Ensure database is initialized"]
         )
 
+# ListArchivedIssuesInput fields echoed back as filters_applied
+_ARCHIVE_FILTER_KEYS = frozenset({"priority", "module", "type", "search_keyword", "date_from", "date_to"})
+
 @conditional_mcp_tool
 @strict_project_scope
 def pm_list_archived_issues(input: ListArchivedIssuesInput) -> Dict[str, Any]:
@@ -580,22 +724,20 @@ def pm_list_archived_issues(input: ListArchivedIssuesInput) -> Dict[str, Any]:
     All returned issues are clearly marked as archived.
     """
     try:
-        with DatabaseSession():
+        with ReadOnlyDatabaseSession():
             pid = _require_project_id(input.project_id)
             if not pid:
                 return err("No project found. Initialize one with pm_init_project()", {})
 
-            # Prepare filters for archived issues
-            filters = {
-                'priority': input.priority,
-                'module': input.module,
-                'type': input.type,
-                'search_keyword': input.search_keyword,
-                'date_from': input.date_from,
-                'date_to': input.date_to
-            }
-
-            issues = PMDatabase.find_archived_issues(pid, **filters)
+            issues = PMDatabase.find_archived_issues(
+                pid,
+                priority=input.priority,
+                module=input.module,
+                issue_type=input.type,
+                search_keyword=input.search_keyword,
+                date_from=input.date_from,
+                date_to=input.date_to,
+            )
 
             # Limit results
             if input.limit:
@@ -614,7 +756,7 @@ def pm_list_archived_issues(input: ListArchivedIssuesInput) -> Dict[str, Any]:
                 {
                     "archived_issues": archived_issues,
                     "count": len(archived_issues),
-                    "filters_applied": {k: v for k, v in filters.items() if v is not None}
+                    "filters_applied": input.model_dump(include=_ARCHIVE_FILTER_KEYS, exclude_none=True)
                 },
                 hints=[
                     f"Use pm_get_archived_issue --issue-key {archived_issues[0]['key']} for full historical details" if archived_issues else "No archived issues match your filters",
@@ -622,11 +764,10 @@ def pm_list_archived_issues(input: ListArchivedIssuesInput) -> Dict[str, Any]:
                 ]
             )
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to list archived issues: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check database connectivity", "Verify filters are valid"]
         )
 
@@ -639,7 +780,7 @@ def pm_get_archived_issue(input: GetArchivedIssueInput) -> Dict[str, Any]:
     Clearly indicates this is archived/historical data.
     """
     try:
-        with DatabaseSession():
+        with ReadOnlyDatabaseSession():
             pid = _require_project_id(input.project_id)
 
             # Get the archived issue
@@ -658,10 +799,13 @@ def pm_get_archived_issue(input: GetArchivedIssueInput) -> Dict[str, Any]:
                 "archived_status": "ARCHIVED - This is historical/completed work"
             }
 
+            # Tasks are loaded once and shared with the worklogs that reference them
+            task_models = PMDatabase.get_issue_tasks(issue) if input.include_tasks else None
+
             # Add work logs if requested
             if input.include_worklogs:
                 worklogs = []
-                for log in issue.worklogs:
+                for log in PMDatabase.get_issue_worklogs(issue, task_models):
                     log_data = log.to_dict()
                     # Include artifacts and context
                     log_data['artifacts'] = log.artifacts
@@ -673,7 +817,7 @@ def pm_get_archived_issue(input: GetArchivedIssueInput) -> Dict[str, Any]:
             # Add tasks if requested
             if input.include_tasks:
                 tasks = []
-                for task in issue.tasks:
+                for task in task_models:
                     task_data = task.to_dict()
                     task_data['checklist'] = task.checklist
                     task_data['notes'] = task.notes
@@ -681,7 +825,7 @@ def pm_get_archived_issue(input: GetArchivedIssueInput) -> Dict[str, Any]:
                 result_data["tasks"] = tasks
 
             # Add project info
-            result_data["project"] = PMDatabase._project_to_dict(issue.project)
+            result_data["project"] = _project_dict_cached(issue.project)
 
             return ok(
                 f"Archived issue {input.issue_key} retrieved",
@@ -694,11 +838,10 @@ def pm_get_archived_issue(input: GetArchivedIssueInput) -> Dict[str, Any]:
             )
 
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to get archived issue: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check database connectivity", "Verify issue key format"]
         )
 
@@ -725,11 +868,10 @@ def pm_create_issue(input: CreateIssueInput) -> Dict[str, Any]:
             return ok("Issue created", {"issue": issue.to_rich_dict()},
                       hints=[f"Start work: pm_start_work --issue-key {issue.key}"])
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to create issue: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check database connectivity", "Verify all required fields are provided"]
         )
 
@@ -743,7 +885,7 @@ def pm_start_work(input: StartWorkInput) -> Dict[str, Any]:
     try:
         with DatabaseSession():
             # Get issue scoped to current project
-            # The decorator adds project_id, but we need to get it properly
+            # Resolved once by strict_project_scope
             project_id = _require_project_id(None)
             issue = PMDatabase.get_issue_scoped(project_id, input.issue_key)
             if issue is None:
@@ -755,7 +897,7 @@ def pm_start_work(input: StartWorkInput) -> Dict[str, Any]:
 
             # Validate dependencies if requested
             if input.validate_dependencies:
-                all_issues = PMDatabase.get_issues(project_id=issue_dict['project_id'], limit=1000)
+                all_issues = PMDatabase.get_dependency_graph(project_id=issue_dict['project_id'])
                 deps = analyze_dependencies(issue_dict, all_issues)
                 if not deps['ready_to_work']:
                     pending = [d['key'] for d in deps['depends_on'] if not d['ready']]
@@ -765,23 +907,25 @@ def pm_start_work(input: StartWorkInput) -> Dict[str, Any]:
                         hints=[f"Complete dependencies first: {', '.join(pending)}"]
                     )
 
-            # Update status to in_progress
-            update_data = issue_dict.copy()
-            old_status = issue_dict['status']
-            update_data['status'] = 'in_progress'
-            updated_issue = PMDatabase.create_or_update_issue(update_data)
+            # Status change and its worklog commit together
+            with db_proxy.atomic():
+                # Update status to in_progress
+                update_data = issue_dict.copy()
+                old_status = issue_dict['status']
+                update_data['status'] = 'in_progress'
+                updated_issue = PMDatabase.create_or_update_issue(update_data)
 
-            # Log work start
-            PMDatabase.add_worklog({
-                'issue_key': input.issue_key,
-                'agent': Config.DEFAULT_OWNER,
-                'activity': 'planning',
-                'summary': f"Started work on {input.issue_key}: {issue_dict['title']}",
-                'context': {
-                    'previous_status': old_status,
-                    'notes': input.notes or "Beginning implementation"
-                }
-            })
+                # Log work start
+                PMDatabase.add_worklog({
+                    'issue_key': input.issue_key,
+                    'agent': Config.DEFAULT_OWNER,
+                    'activity': 'planning',
+                    'summary': f"Started work on {input.issue_key}: {issue_dict['title']}",
+                    'context': {
+                        'previous_status': old_status,
+                        'notes': input.notes or "Beginning implementation"
+                    }
+                })
 
             result_data = {
                 "issue": updated_issue,
@@ -835,11 +979,10 @@ def pm_start_work(input: StartWorkInput) -> Dict[str, Any]:
     except ScopeError as se:
         return err(str(se))
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to start work: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check issue exists", "Verify issue is in startable state"]
         )
 
@@ -853,18 +996,21 @@ def pm_log_work(input: LogWorkInput) -> Dict[str, Any]:
     try:
         with DatabaseSession():
             # Validate issue belongs to current project - using strict scope
-            # The decorator adds project_id, but we need to get it properly
+            # Resolved once by strict_project_scope
             project_id = _require_project_id(None)
             issue = PMDatabase.get_issue_scoped(project_id, input.issue_key)
             if issue is None:
                 return err("Issue not found in current project scope")
             issue_dict = PMDatabase._issue_to_dict(issue)
 
+            # Parsed once for both the stored context and the response
+            hours_spent = parse_duration(input.time_spent) if input.time_spent else 0
+
             # Build work log data
             context_data = {}
             if input.time_spent:
                 context_data['time_spent'] = input.time_spent
-                context_data['hours_logged'] = parse_duration(input.time_spent)
+                context_data['hours_logged'] = hours_spent
             if input.blockers:
                 context_data['blockers'] = input.blockers
             if input.decisions:
@@ -884,9 +1030,6 @@ def pm_log_work(input: LogWorkInput) -> Dict[str, Any]:
 
             worklog = PMDatabase.add_worklog(worklog_data)
 
-            # Calculate time for response
-            hours_spent = parse_duration(input.time_spent) if input.time_spent else 0
-
             return standard_response(
                 success=True,
                 message=f"Logged {input.activity} work on {input.issue_key}",
@@ -903,11 +1046,10 @@ def pm_log_work(input: LogWorkInput) -> Dict[str, Any]:
             )
 
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to log work: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check issue exists", "Verify time format (e.g., '2h', '30m')"]
         )
 
@@ -929,61 +1071,89 @@ def pm_update_status(input: UpdateStatusInput) -> Dict[str, Any]:
             issue_dict = PMDatabase._issue_to_dict(issue)
             old_status = issue_dict['status']
 
-            # Validate workflow transition
-            valid_transitions = {
-                'proposed': ['in_progress', 'canceled'],
-                'in_progress': ['blocked', 'review', 'canceled'],
-                'blocked': ['in_progress', 'canceled'],
-                'review': ['in_progress', 'done', 'canceled'],
-                'done': ['in_progress'],  # Can reopen
-                'canceled': ['proposed']  # Can revive
-            }
+            # Re-applying the current status only writes what else changed:
+            # a new blocker reason and/or notes. Otherwise no UPDATE, no worklog
+            if input.status == old_status:
+                reason_changed = False
+                if old_status == 'blocked' and input.blocker_reason:
+                    planning = _get_issue_field_json(issue, 'planning')
+                    reason_changed = input.blocker_reason != planning.get('blocker_reason')
+                if not reason_changed and not input.notes:
+                    return ok(f"Issue {input.issue_key} is already {old_status}",
+                              {"issue": issue_dict, "old_status": old_status, "new_status": old_status})
+
+                with db_proxy.atomic():
+                    if reason_changed:
+                        planning['blocker_reason'] = input.blocker_reason
+                        issue_dict = PMDatabase.update_issue_fields(issue, planning=_json_dumps(planning))
+
+                    context_data = {'previous_status': old_status, 'new_status': old_status}
+                    if input.notes:
+                        context_data['notes'] = input.notes
+                    if reason_changed:
+                        context_data['blocker_reason'] = input.blocker_reason
 
-            if old_status not in valid_transitions:
+                    PMDatabase.add_worklog({
+                        'issue_key': input.issue_key,
+                        'agent': Config.DEFAULT_OWNER,
+                        'activity': 'planning',
+                        'summary': ("Blocker reason updated" if reason_changed
+                                    else f"Status note added ({old_status})"),
+                        'context': context_data
+                    })
+
+                return ok(f"Issue {input.issue_key} is already {old_status}; "
+                          f"{'blocker reason updated' if reason_changed else 'notes logged'}",
+                          {"issue": issue_dict, "old_status": old_status, "new_status": old_status})
+
+            # Validate workflow transition
+            allowed = _VALID_STATUS_TRANSITIONS.get(old_status)
+            if allowed is None:
                 return err(f"Unknown current status: {old_status}")
 
-            if input.status not in valid_transitions.get(old_status, []):
+            if input.status not in allowed:
                 return standard_response(
                     success=False,
                     message=f"Invalid status transition: {old_status} → {input.status}",
-                    data={"valid_transitions": valid_transitions.get(old_status, [])},
-                    hints=[f"Valid transitions from {old_status}: {', '.join(valid_transitions.get(old_status, []))}"]
+                    data={"valid_transitions": list(allowed)},
+                    hints=_STATUS_TRANSITION_HINTS[old_status]
                 )
 
             # Check for blocker reason if blocking
             if input.status == 'blocked' and not input.blocker_reason:
                 return err("Blocker reason required when setting status to 'blocked'")
 
-            # Update the issue status
-            update_data = issue_dict.copy()
-            update_data['status'] = input.status
+            # Status change and its worklog commit together
+            with db_proxy.atomic():
+                # Update the issue status
+                changes = {'status': input.status}
 
-            # Add blocker info if blocking
-            if input.status == 'blocked' and input.blocker_reason:
-                planning = _get_issue_field_json(issue, 'planning')
-                planning['blocker_reason'] = input.blocker_reason
-                planning['blocked_at'] = datetime.utcnow().isoformat()
-                update_data['planning'] = json.dumps(planning)
+                # Add blocker info if blocking
+                if input.status == 'blocked' and input.blocker_reason:
+                    planning = _get_issue_field_json(issue, 'planning')
+                    planning['blocker_reason'] = input.blocker_reason
+                    planning['blocked_at'] = datetime.utcnow().isoformat()
+                    changes['planning'] = _json_dumps(planning)
 
-            updated_issue = PMDatabase.create_or_update_issue(update_data)
+                updated_issue = PMDatabase.update_issue_fields(issue, **changes)
 
-            # Log the status change
-            context_data = {
-                'previous_status': old_status,
-                'new_status': input.status
-            }
-            if input.notes:
-                context_data['notes'] = input.notes
-            if input.blocker_reason:
-                context_data['blocker_reason'] = input.blocker_reason
+                # Log the status change
+                context_data = {
+                    'previous_status': old_status,
+                    'new_status': input.status
+                }
+                if input.notes:
+                    context_data['notes'] = input.notes
+                if input.blocker_reason:
+                    context_data['blocker_reason'] = input.blocker_reason
 
-            PMDatabase.add_worklog({
-                'issue_key': input.issue_key,
-                'agent': Config.DEFAULT_OWNER,
-                'activity': 'planning',
-                'summary': f"Status changed from {old_status} to {input.status}",
-                'context': context_data
-            })
+                PMDatabase.add_worklog({
+                    'issue_key': input.issue_key,
+                    'agent': Config.DEFAULT_OWNER,
+                    'activity': 'planning',
+                    'summary': f"Status changed from {old_status} to {input.status}",
+                    'context': context_data
+                })
 
             # Build response hints based on new status
             hints = []
@@ -1012,11 +1182,10 @@ def pm_update_status(input: UpdateStatusInput) -> Dict[str, Any]:
             )
 
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to update status: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check issue exists", "Verify status transition is valid"]
         )
 
@@ -1050,12 +1219,7 @@ def pm_delete_issue(input: DeleteIssueInput) -> Dict[str, Any]:
             dependencies = issue_dict.get('dependencies', [])
             if dependencies:
                 # Check if any issues depend on this one
-                from src.jira_lite.models import Issue as JiraIssue
-                all_issues = JiraIssue.select().where(JiraIssue.project == issue.project)
-                blocked_by_this = []
-                for other_issue in all_issues:
-                    if other_issue.dependencies and input.issue_key in other_issue.dependencies:
-                        blocked_by_this.append(other_issue.key)
+                blocked_by_this = PMDatabase.get_dependent_issue_keys(issue.project, input.issue_key)
 
                 if blocked_by_this:
                     return standard_response(
@@ -1073,21 +1237,16 @@ def pm_delete_issue(input: DeleteIssueInput) -> Dict[str, Any]:
                 "worklogs_deleted": 0
             }
 
-            if input.cascade:
-                # Delete all tasks
-                tasks = Task.select().where(Task.issue == issue)
-                deletion_summary["tasks_deleted"] = tasks.count()
-                for task in tasks:
-                    task.delete_instance()
-
-                # Delete all worklogs
-                worklogs = WorkLog.select().where(WorkLog.issue == issue)
-                deletion_summary["worklogs_deleted"] = worklogs.count()
-                for worklog in worklogs:
-                    worklog.delete_instance()
+            # One transaction for the whole cascade; bulk DELETEs return
+            # their affected row counts
+            with db_proxy.atomic():
+                if input.cascade:
+                    # Worklogs first, so deleting tasks has no task refs to null out
+                    deletion_summary["worklogs_deleted"] = WorkLog.delete().where(WorkLog.issue == issue).execute()
+                    deletion_summary["tasks_deleted"] = Task.delete().where(Task.issue == issue).execute()
 
-            # Delete the issue itself
-            issue.delete_instance()
+                # Delete the issue itself
+                issue.delete_instance()
 
             # Log the deletion if reason provided
             if input.reason:
@@ -1107,11 +1266,10 @@ def pm_delete_issue(input: DeleteIssueInput) -> Dict[str, Any]:
             )
 
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to delete issue: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check issue exists", "Ensure no other issues depend on this one"]
         )
 
@@ -1127,20 +1285,12 @@ def pm_create_branch(input: CreateBranchInput) -> Dict[str, Any]:
     """
     try:
         with DatabaseSession():
-            issue = PMDatabase.get_issue(input.issue_key)
+            issue, project = PMDatabase.get_issue_with_project(input.issue_key)
             if not issue:
                 return standard_response(
                     success=False,
                     message=f"Issue {input.issue_key} not found"
                 )
-            issue_dict = PMDatabase._issue_to_dict(issue)
-
-            project = PMDatabase.get_project(issue_dict['project_id'])
-            if not project:
-                return standard_response(
-                    success=False,
-                    message=f"Project {issue_dict['project_id']} not found"
-                )
 
             # Rate limiting check
             if not git_rate_limiter.can_proceed():
@@ -1151,8 +1301,8 @@ def pm_create_branch(input: CreateBranchInput) -> Dict[str, Any]:
                 )
 
             # Generate or validate branch name
-            branch_name = input.branch_name or issue_dict.get('branch_hint') or generate_branch_name(
-                input.issue_key, issue_dict['type'], issue_dict['title']
+            branch_name = input.branch_name or issue.branch_hint or generate_branch_name(
+                input.issue_key, issue.type, issue.title
             )
 
             if not validate_branch_name(branch_name):
@@ -1162,26 +1312,8 @@ def pm_create_branch(input: CreateBranchInput) -> Dict[str, Any]:
                     hints=["Use alphanumeric characters and hyphens only"]
                 )
 
-            # Get project dict for path access
-            if hasattr(project, 'absolute_path'):
-                project_path = Path(project.absolute_path)
-            else:
-                project_dict = PMDatabase._project_to_dict(project) if project else {}
-                project_path = Path(project_dict['absolute_path']) if project_dict else Path.cwd()
-
-            # Check if issue belongs to a submodule and adjust working path
-            working_path = project_path
-            project_dict = PMDatabase._project_to_dict(project)
-            if issue.module and project_dict.get('metadata', {}).get('submodules'):
-                submodules = project_dict['metadata']['submodules']
-                for submodule in submodules:
-                    if submodule['name'] == issue.module:
-                        # This issue belongs to a specific submodule
-                        submodule_path = project_path / submodule['path']
-                        if submodule_path.exists() and (submodule_path / '.git').exists():
-                            # Submodule has its own git repo
-                            working_path = submodule_path
-                        break
+            # Issues in a submodule with its own repo run git there
+            working_path = _resolve_working_path(project, issue.module)
 
             # Ensure git setup
             setup_success = ensure_project_git_setup_sync(working_path)
@@ -1202,33 +1334,34 @@ def pm_create_branch(input: CreateBranchInput) -> Dict[str, Any]:
                     hints=[f"Ensure branch '{input.base_branch}' exists"]
                 )
 
-            # Pull latest changes (handle gracefully if no remote)
-            pull_result = run_git_command_sync(['pull'], cwd=working_path)
-            # Don't fail on pull errors - might be offline or no remote
+            # Pull latest changes when there is a remote to pull from
+            if repo_has_remote(working_path):
+                run_git_command_sync(['pull'], cwd=working_path)
+                # Don't fail on pull errors - might be offline
 
             # Create new branch
             git_result = run_git_command_sync(['checkout', '-b', branch_name], cwd=working_path)
 
             if git_result['success']:
-                # Update issue with branch info
-                update_data = issue_dict.copy()
-                update_data['branch_hint'] = branch_name
-                PMDatabase.create_or_update_issue(update_data)
+                # Branch hint and its worklog commit together
+                with db_proxy.atomic():
+                    # Update issue with branch info
+                    PMDatabase.set_issue_branch_hint(issue, branch_name)
 
-                # Log branch creation
-                PMDatabase.add_worklog({
-                    'issue_key': input.issue_key,
-                    'agent': Config.DEFAULT_OWNER,
-                    'activity': 'code',
-                    'summary': f"Created branch: {branch_name}",
-                    'artifacts': [
-                        {
-                            'type': 'branch',
-                            'name': branch_name,
-                            'base': input.base_branch
-                        }
-                    ]
-                })
+                    # Log branch creation
+                    PMDatabase.add_worklog({
+                        'issue_key': input.issue_key,
+                        'agent': Config.DEFAULT_OWNER,
+                        'activity': 'code',
+                        'summary': f"Created branch: {branch_name}",
+                        'artifacts': [
+                            {
+                                'type': 'branch',
+                                'name': branch_name,
+                                'base': input.base_branch
+                            }
+                        ]
+                    })
 
                 sanitized = sanitize_git_output(git_result['output'], git_result.get('error', ''))
 
@@ -1258,6 +1391,7 @@ def pm_create_branch(input: CreateBranchInput) -> Dict[str, Any]:
         return standard_response(
             success=False,
             message=f"Branch creation failed: {type(e).__name__}",
+            data={"error_details": _error_details(e)},
             hints=["Check git repository status", "Verify project path exists"]
         )
 
@@ -1270,20 +1404,12 @@ def pm_commit(input: CommitInput) -> Dict[str, Any]:
     """
     try:
         with DatabaseSession():
-            issue = PMDatabase.get_issue(input.issue_key)
+            issue, project = PMDatabase.get_issue_with_project(input.issue_key)
             if not issue:
                 return standard_response(
                     success=False,
                     message=f"Issue {input.issue_key} not found"
                 )
-            issue_dict = PMDatabase._issue_to_dict(issue)
-
-            project = PMDatabase.get_project(issue_dict['project_id'])
-            if not project:
-                return standard_response(
-                    success=False,
-                    message=f"Project {issue_dict['project_id']} not found"
-                )
 
             # Rate limiting
             if not git_rate_limiter.can_proceed():
@@ -1292,26 +1418,8 @@ def pm_commit(input: CommitInput) -> Dict[str, Any]:
                     message="Rate limit exceeded for git operations"
                 )
 
-            # Get project dict for path access
-            if hasattr(project, 'absolute_path'):
-                project_path = Path(project.absolute_path)
-            else:
-                project_dict = PMDatabase._project_to_dict(project) if project else {}
-                project_path = Path(project_dict['absolute_path']) if project_dict else Path.cwd()
-
-            # Check if issue belongs to a submodule and adjust working path
-            working_path = project_path
-            project_dict = PMDatabase._project_to_dict(project)
-            if issue.module and project_dict.get('metadata', {}).get('submodules'):
-                submodules = project_dict['metadata']['submodules']
-                for submodule in submodules:
-                    if submodule['name'] == issue.module:
-                        # This issue belongs to a specific submodule
-                        submodule_path = project_path / submodule['path']
-                        if submodule_path.exists() and (submodule_path / '.git').exists():
-                            # Submodule has its own git repo
-                            working_path = submodule_path
-                        break
+            # Issues in a submodule with its own repo run git there
+            working_path = _resolve_working_path(project, issue.module)
 
             # Ensure git identity is set
             setup_success = ensure_project_git_setup_sync(working_path)
@@ -1326,14 +1434,15 @@ def pm_commit(input: CommitInput) -> Dict[str, Any]:
 
             # Stage files if specified
             if input.files:
-                for file in input.files:
-                    git_result = run_git_command_sync(['add', file], cwd=working_path)
-                    if not git_result['success']:
-                        return standard_response(
-                            success=False,
-                            message=f"Failed to stage file: {file}",
-                            data={"git_error": git_result['error']}
-                        )
+                # One git process for all paths; git stages none of them
+                # if any pathspec fails
+                git_result = run_git_command_sync(['add', '--', *input.files], cwd=working_path)
+                if not git_result['success']:
+                    return standard_response(
+                        success=False,
+                        message=f"Failed to stage files: {', '.join(input.files)}",
+                        data={"git_error": git_result['error']}
+                    )
             else:
                 # Stage all changes
                 git_result = run_git_command_sync(['add', '-A'], cwd=working_path)
@@ -1346,9 +1455,12 @@ def pm_commit(input: CommitInput) -> Dict[str, Any]:
             git_result = run_git_command_sync(commit_args, cwd=working_path)
 
             if git_result['success']:
-                # Get commit SHA
-                sha_result = run_git_command_sync(['rev-parse', 'HEAD'], cwd=working_path)
-                commit_sha = sha_result['output'][:7] if sha_result['success'] else 'unknown'
+                # Get commit SHA from the commit summary line; only spawn
+                # rev-parse if it isn't there
+                commit_sha = parse_commit_sha(git_result['output'])
+                if not commit_sha:
+                    sha_result = run_git_command_sync(['rev-parse', 'HEAD'], cwd=working_path)
+                    commit_sha = sha_result['output'][:7] if sha_result['success'] else 'unknown'
 
                 # Log commit as work activity if requested
                 if input.log_work:
@@ -1392,11 +1504,10 @@ def pm_commit(input: CommitInput) -> Dict[str, Any]:
                 )
 
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Commit failed: {str(e)}",
-            data={"error_details": {"error": str(e), "type": type(e).__name__, "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check git repository status", "Verify working directory"]
         )
 
@@ -1412,38 +1523,41 @@ def pm_my_queue(input: MyQueueInput) -> Dict[str, Any]:
     owner = input.owner or Config.DEFAULT_OWNER
 
     try:
-        with DatabaseSession():
-            # Get assigned issues
-            my_issues = PMDatabase.get_issues(owner=owner, limit=100)
+        with ReadOnlyDatabaseSession():
+            # Get assigned issues in actionable statuses
+            actionable = PMDatabase.get_issues(owner=owner, statuses=ACTIONABLE_STATUSES, limit=100)
 
-            # Filter to actionable statuses
-            actionable = [
-                i for i in my_issues
-                if i['status'] in ['proposed', 'in_progress', 'review']
-            ]
+            # Load the dependency graph once if blocked analysis or dependency sort needs it
+            if input.include_blocked or input.sort_by == 'dependency':
+                all_issues = PMDatabase.get_dependency_graph()
+                dep_index = build_dependency_index(all_issues)
 
             # Add blocked issues that might be unblockable
             if input.include_blocked:
                 blocked_issues = PMDatabase.get_blocked_issues()
-                all_issues = PMDatabase.get_issues(limit=1000)
 
                 for blocked in blocked_issues:
-                    deps = analyze_dependencies(blocked, all_issues)
+                    deps = analyze_dependencies(blocked, all_issues, dep_index)
                     if deps['ready_to_work']:
                         blocked['unblockable'] = True
                         actionable.append(blocked)
 
             # Sort based on criteria
             if input.sort_by == 'priority':
-                priority_order = {'P1': 1, 'P2': 2, 'P3': 3, 'P4': 4, 'P5': 5}
-                actionable.sort(key=lambda i: priority_order.get(i['priority'], 6))
+                # Priorities are a fixed small set: stable bucket sort in one
+                # pass, unknown priorities last
+                buckets = [[] for _ in range(len(PRIORITY_ORDER) + 1)]
+                for issue in actionable:
+                    buckets[PRIORITY_ORDER.get(issue['priority'], len(PRIORITY_ORDER) + 1) - 1].append(issue)
+                actionable = [issue for bucket in buckets for issue in bucket]
             elif input.sort_by == 'urgency':
-                actionable.sort(key=calculate_urgency_score, reverse=True)
+                for issue in actionable:
+                    issue['urgency_score'] = calculate_urgency_score(issue)
+                actionable.sort(key=lambda i: i['urgency_score'], reverse=True)
             elif input.sort_by == 'dependency':
                 # Sort by blocking others first, then by dependency count
-                all_issues = PMDatabase.get_issues(limit=1000)
                 def dep_score(issue):
-                    deps = analyze_dependencies(issue, all_issues)
+                    deps = analyze_dependencies(issue, all_issues, dep_index)
                     return (deps['blocking_count'] * 10) - deps['dependency_count']
                 actionable.sort(key=dep_score, reverse=True)
             else:  # age
@@ -1451,8 +1565,9 @@ def pm_my_queue(input: MyQueueInput) -> Dict[str, Any]:
 
             # Format queue with recommendations
             queue = []
+            now = datetime.utcnow()
             for issue in actionable[:input.limit]:
-                age_days = (datetime.utcnow() - datetime.fromisoformat(issue['created_utc'].rstrip('Z'))).days
+                age_days = (now - parse_utc(issue['created_utc'])).days
 
                 item = {
                     "key": issue['key'],
@@ -1461,7 +1576,7 @@ def pm_my_queue(input: MyQueueInput) -> Dict[str, Any]:
                     "status": issue['status'],
                     "priority": issue['priority'],
                     "age_days": age_days,
-                    "urgency_score": calculate_urgency_score(issue)
+                    "urgency_score": issue['urgency_score'] if 'urgency_score' in issue else calculate_urgency_score(issue)
                 }
 
                 # Add actionable recommendations
@@ -1492,7 +1607,7 @@ def pm_my_queue(input: MyQueueInput) -> Dict[str, Any]:
                 data={
                     "owner": owner,
                     "queue": queue,
-                    "total_assigned": len(my_issues),
+                    "total_assigned": PMDatabase.count_issues(owner=owner),
                     "actionable_count": len(actionable),
                     "sort_method": input.sort_by
                 },
@@ -1503,6 +1618,7 @@ def pm_my_queue(input: MyQueueInput) -> Dict[str, Any]:
         return standard_response(
             success=False,
             message=f"Failed to get work queue: {type(e).__name__}",
+            data={"error_details": _error_details(e)},
             hints=["Check database connectivity"]
         )
 
@@ -1513,7 +1629,7 @@ def pm_blocked_issues(input: BlockedIssuesInput) -> Dict[str, Any]:
     Helps identify systematic blockers and resolution paths.
     """
     try:
-        with DatabaseSession():
+        with ReadOnlyDatabaseSession():
             blocked = PMDatabase.get_blocked_issues(project_id=input.project_id)
 
             if not blocked:
@@ -1524,7 +1640,13 @@ def pm_blocked_issues(input: BlockedIssuesInput) -> Dict[str, Any]:
                     hints=["Great! No blockers to resolve"]
                 )
 
-            all_issues = PMDatabase.get_issues(project_id=input.project_id, limit=1000)
+            # Readiness only depends on whether each dependency is done, so
+            # look up just those statuses instead of the whole issue graph
+            dep_status = PMDatabase.get_issue_statuses(
+                input.project_id,
+                {dep_key for issue in blocked for dep_key in issue.get('dependencies', [])}
+            )
+            now = datetime.utcnow()
             result_issues = []
 
             for issue in blocked:
@@ -1536,18 +1658,17 @@ def pm_blocked_issues(input: BlockedIssuesInput) -> Dict[str, Any]:
                 }
 
                 # Analyze dependencies
-                deps = analyze_dependencies(issue, all_issues)
-                blocked_info['can_unblock'] = deps['ready_to_work']
+                pending = [dep_key for dep_key in issue.get('dependencies', [])
+                           if dep_status.get(dep_key) != 'done']
+                blocked_info['can_unblock'] = not pending
 
-                if deps['ready_to_work']:
+                if not pending:
                     blocked_info['unblock_actions'].append('All dependencies completed - ready to resume')
                 else:
-                    pending = [d['key'] for d in deps['depends_on'] if not d['ready']]
                     blocked_info['unblock_actions'].append(f"Waiting for: {', '.join(pending)}")
 
                 # Check how long it's been blocked
-                updated = datetime.fromisoformat(issue['updated_utc'].rstrip('Z'))
-                days_blocked = (datetime.utcnow() - updated).days
+                days_blocked = (now - parse_utc(issue['updated_utc'])).days
                 blocked_info['days_blocked'] = days_blocked
 
                 if input.include_stale and days_blocked > 7:
@@ -1592,6 +1713,7 @@ def pm_blocked_issues(input: BlockedIssuesInput) -> Dict[str, Any]:
         return standard_response(
             success=False,
             message=f"Failed to analyze blocked issues: {type(e).__name__}",
+            data={"error_details": _error_details(e)},
             hints=["Check database connectivity"]
         )
 
@@ -1608,38 +1730,21 @@ def pm_daily_standup(input: DailyStandupInput) -> Dict[str, Any]:
     owner = input.owner or Config.DEFAULT_OWNER
 
     try:
-        with DatabaseSession():
-            # Get yesterday's work logs
-            yesterday = datetime.utcnow() - timedelta(days=1)
-            yesterday_work = PMDatabase.get_recent_worklogs(
-                project_id=input.project_id,
-                limit=50
-            )
-
-            # Filter to yesterday and specific owner
-            yesterday_work = [
-                w for w in yesterday_work
-                if (datetime.fromisoformat(w['timestamp_utc'].rstrip('Z')).date() == yesterday.date() and
-                    w.get('agent') == owner)
-            ]
-
-            # Get today's planned work (in_progress issues)
-            today_issues = PMDatabase.get_issues(
-                project_id=input.project_id,
-                owner=owner,
-                status='in_progress',
-                limit=10
+        with ReadOnlyDatabaseSession():
+            # Yesterday's work logs for this owner (UTC calendar day), today's
+            # planned work (in_progress issues) and blockers
+            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+            yesterday_work, today_issues, blocked_issues = PMDatabase.get_standup_bundle(
+                input.project_id, owner, today_start - timedelta(days=1), today_start
             )
 
-            # Get blockers
-            blocked_issues = PMDatabase.get_blocked_issues(project_id=input.project_id)
-
             # Format based on requested format
+            today_str = datetime.now().strftime('%Y-%m-%d')
             if input.format == 'markdown':
-                content = format_standup_report(yesterday_work, today_issues, blocked_issues)
+                content = format_standup_report(yesterday_work, today_issues, blocked_issues, today_str)
             elif input.format == 'structured':
                 content = {
-                    "date": datetime.now().strftime('%Y-%m-%d'),
+                    "date": today_str,
                     "yesterday": [
                         {
                             "issue": w['issue_key'],
@@ -1663,27 +1768,17 @@ def pm_daily_standup(input: DailyStandupInput) -> Dict[str, Any]:
                     ]
                 }
             else:  # text
-                lines = [f"Daily Standup - {datetime.now().strftime('%Y-%m-%d')}"]
-                lines.append(f"\nOwner: {owner}")
-                lines.append("\nYesterday:")
-                for w in yesterday_work:
-                    lines.append(f"- {w['issue_key']}: {w['summary']}")
-                if not yesterday_work:
-                    lines.append("- No logged work yesterday")
-
-                lines.append("\nToday:")
-                for i in today_issues:
-                    lines.append(f"- {i['key']}: {i['title']} ({i['priority']})")
-                if not today_issues:
-                    lines.append("- No active issues")
-
-                lines.append("\nBlockers:")
-                for b in blocked_issues[:3]:  # Limit to prevent spam
-                    lines.append(f"- {b['key']}: {b['title']}")
-                if not blocked_issues:
-                    lines.append("- No blockers")
-
-                content = "\n".join(lines)
+                content = "\n".join([
+                    f"Daily Standup - {today_str}",
+                    f"\nOwner: {owner}",
+                    "\nYesterday:",
+                    *(list(map(_STANDUP_WORKLOG_LINE, yesterday_work)) or ["- No logged work yesterday"]),
+                    "\nToday:",
+                    *(list(map(_STANDUP_TODAY_LINE, today_issues)) or ["- No active issues"]),
+                    "\nBlockers:",
+                    # Limit to prevent spam
+                    *(list(map(_STANDUP_BLOCKER_LINE, blocked_issues[:3])) or ["- No blockers"]),
+                ])
 
             hints = []
             if not yesterday_work:
@@ -1714,6 +1809,7 @@ def pm_daily_standup(input: DailyStandupInput) -> Dict[str, Any]:
         return standard_response(
             success=False,
             message=f"Failed to generate standup: {type(e).__name__}",
+            data={"error_details": _error_details(e)},
             hints=["Check database connectivity", "Verify project exists"]
         )
 
@@ -1819,6 +1915,11 @@ def main():
 
 # =============== Initialization Tools ===============
 
+# pm_init_project treats a top-level directory as a submodule if its name
+# contains one of these, or failing that, if it holds one of these files
+_SUBMODULE_NAME_PATTERNS = ('backend', 'frontend', 'infra', 'api', 'web', 'mobile', 'testing', 'docs')
+_SUBMODULE_PROJECT_FILES = ('package.json', 'requirements.txt', 'pom.xml', 'build.gradle', 'Cargo.toml')
+
 @conditional_mcp_tool
 def pm_init_project(project_path: str = ".", project_name: Optional[str] = None, auto_mode: bool = False) -> Dict[str, Any]:
     """
@@ -1832,35 +1933,32 @@ def pm_init_project(project_path: str = ".", project_name: Optional[str] = None,
     """
     try:
         with DatabaseSession():
-            from datetime import datetime
-            import json
             path = Path(project_path or ".").resolve()
             slug = (project_name or path.name).lower().replace(" ", "-")
 
-            # Detect submodules by looking for subdirectories with specific patterns
+            # Detect submodules by looking for subdirectories with specific patterns.
+            # scandir's entries carry their file type, so non-directories cost no stat.
             submodules = []
-            for subdir in path.iterdir():
-                if subdir.is_dir() and not subdir.name.startswith('.') and not subdir.name.startswith('__'):
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if not entry.is_dir() or entry.name.startswith(('.', '__')):
+                        continue
                     # Check if it looks like a submodule (has backend, frontend, infra, etc. in name)
                     # or has its own package.json, requirements.txt, etc.
-                    subdir_name = subdir.name.lower()
-                    is_submodule = False
-
-                    # Check by naming patterns
-                    if any(pattern in subdir_name for pattern in ['backend', 'frontend', 'infra', 'api', 'web', 'mobile', 'testing', 'docs']):
-                        is_submodule = True
-                    # Check by project files
-                    elif any((subdir / f).exists() for f in ['package.json', 'requirements.txt', 'pom.xml', 'build.gradle', 'Cargo.toml']):
-                        is_submodule = True
+                    subdir_name = entry.name.lower()
+                    is_submodule = (
+                        any(pattern in subdir_name for pattern in _SUBMODULE_NAME_PATTERNS)
+                        or any(os.path.exists(os.path.join(entry.path, f)) for f in _SUBMODULE_PROJECT_FILES)
+                    )
 
                     if is_submodule:
-                        # Check if it has its own git repo
-                        has_git = (subdir / '.git').exists()
+                        subdir = Path(entry.path)
                         submodules.append({
-                            'name': subdir.name,
-                            'path': str(subdir.relative_to(path)),
-                            'absolute_path': str(subdir),
-                            'is_separate_repo': has_git,
+                            'name': entry.name,
+                            'path': entry.name,
+                            'absolute_path': entry.path,
+                            # Check if it has its own git repo
+                            'is_separate_repo': (subdir / '.git').exists(),
                             'manage_separately': True
                         })
 
@@ -1872,26 +1970,25 @@ def pm_init_project(project_path: str = ".", project_name: Optional[str] = None,
             }
 
             # upsert-like behavior
-            existing = [p for p in PMDatabase.get_all_projects() if Path(p.absolute_path).resolve() == path]
-            if existing:
-                proj = existing[0]
+            proj = PMDatabase.get_project_by_path(path)
+            if proj:
                 proj.project_slug = slug
                 proj.metadata = json.dumps(metadata)
                 proj.updated_utc = datetime.utcnow()
                 proj.save()
             else:
                 # simple unique id
-                from database import Project
                 proj = Project.create(
-                    project_id=f"pn_{abs(hash(str(path))) % (10**16)}",
+                    project_id=stable_project_id(path),
                     project_slug=slug,
                     absolute_path=str(path),
                     metadata=json.dumps(metadata),
                     created_utc=datetime.utcnow(),
                     updated_utc=datetime.utcnow(),
                 )
+                invalidate_project_caches()
 
-            result_data = PMDatabase._project_to_dict(proj)
+            result_data = dict(_project_dict_cached(proj))
             if submodules:
                 result_data['submodules_detected'] = len(submodules)
                 result_data['submodule_names'] = [s['name'] for s in submodules]
@@ -1904,11 +2001,10 @@ def pm_init_project(project_path: str = ".", project_name: Optional[str] = None,
 
             return ok("Project initialized with submodule detection", {"project": result_data}, hints=hints)
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to init project: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check if path exists and is a git repository", "Verify you have write permissions"]
         )
 
@@ -1926,7 +2022,7 @@ def pm_register_project(server_url: str = "http://127.0.0.1:1929",
             return standard_response(
                 success=False,
                 message="No project specified and none found",
-                hints=["Run pm_init_project first", "Use pm_list_projects to see available projects"]
+                hints=_REGISTER_NO_PROJECT_HINTS
             )
 
         with DatabaseSession():
@@ -1935,31 +2031,39 @@ def pm_register_project(server_url: str = "http://127.0.0.1:1929",
                 return standard_response(
                     success=False,
                     message=f"Project {project_id} not found",
-                    hints=["Run pm_init_project first"]
+                    hints=_REGISTER_PROJECT_MISSING_HINTS
                 )
 
-            # Prepare registration data - convert model to dict first
-            project_dict = PMDatabase._project_to_dict(project)
+            # Prepare registration data straight from the row - submodules/vcs/mcp
+            # live under metadata, which is parsed once
+            metadata = project.get_metadata()
             registration_data = {
-                'project_id': project_dict['project_id'],
-                'project_slug': project_dict['project_slug'],
-                'absolute_path': project_dict['absolute_path'],
-                'submodules': project_dict.get('submodules', []),
-                'vcs': project_dict.get('vcs', {}),
-                'mcp': project_dict.get('mcp', {})
+                'project_id': project.project_id,
+                'project_slug': project.project_slug,
+                'absolute_path': project.absolute_path,
+                'submodules': metadata.get('submodules') or [],
+                'vcs': metadata.get('vcs') or {},
+                'mcp': metadata.get('mcp') or {}
             }
 
+            if not _REQUESTS_OK:
+                return standard_response(
+                    success=False,
+                    message="requests library not available for web UI registration",
+                    hints=_REGISTER_NO_REQUESTS_HINTS
+                )
+
             # Try to register with web UI
             try:
-                import requests
-                response = requests.post(
+                response = _http().post(
                     f"{server_url}/api/projects/register",
-                    json=registration_data,
-                    timeout=10
+                    data=_json_dumps_bytes(registration_data),
+                    headers={"Content-Type": "application/json"},
+                    timeout=_HTTP_TIMEOUT
                 )
 
                 if response.status_code in [200, 201]:
-                    result = response.json()
+                    result = _json_loads(response.content)
                     return standard_response(
                         success=True,
                         message=f"Registered project with web UI: {result.get('slug')}",
@@ -1977,16 +2081,10 @@ def pm_register_project(server_url: str = "http://127.0.0.1:1929",
                     return standard_response(
                         success=False,
                         message=f"Registration failed: HTTP {response.status_code}",
-                        data={"response": response.text[:200]},
+                        data={"response": response.content[:200].decode("utf-8", errors="replace")},
                         hints=["Ensure Jira-lite server is running", f"Check server URL: {server_url}"]
                     )
 
-            except ImportError:
-                return standard_response(
-                    success=False,
-                    message="requests library not available for web UI registration",
-                    hints=["Install requests: pip install requests", "Or register manually via web UI"]
-                )
             except ScopeError as se:
                 return err(str(se))
             except Exception as e:
@@ -2001,12 +2099,11 @@ def pm_register_project(server_url: str = "http://127.0.0.1:1929",
                 )
 
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to register project: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
-            hints=["Check database connectivity", "Verify project exists"]
+            data={"error_details": _error_details(e)},
+            hints=_REGISTER_ERROR_HINTS
         )
 
 # =============== Critical Missing Tools ===============
@@ -2030,8 +2127,8 @@ def pm_add_submodule(input: AddSubmoduleInput) -> Dict[str, Any]:
                 )
 
             # Get current project metadata
-            project_dict = PMDatabase._project_to_dict(project)
-            metadata = project_dict.get('metadata', {})
+            # (fresh copy: these tools edit it in place)
+            metadata = project.get_metadata()
             submodules = metadata.get('submodules', [])
 
             # Check if submodule already exists
@@ -2062,9 +2159,7 @@ def pm_add_submodule(input: AddSubmoduleInput) -> Dict[str, Any]:
             submodules.append(new_submodule)
 
             # Update metadata
-            metadata['submodules'] = submodules
-            project.metadata = json.dumps(metadata)
-            project.save()
+            PMDatabase.append_project_submodule(project, new_submodule)
 
             return standard_response(
                 success=True,
@@ -2080,11 +2175,10 @@ def pm_add_submodule(input: AddSubmoduleInput) -> Dict[str, Any]:
             )
 
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to add submodule: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}}
+            data={"error_details": _error_details(e)}
         )
 
 @conditional_mcp_tool
@@ -2106,8 +2200,8 @@ def pm_remove_submodule(input: RemoveSubmoduleInput) -> Dict[str, Any]:
                 )
 
             # Get current project metadata
-            project_dict = PMDatabase._project_to_dict(project)
-            metadata = project_dict.get('metadata', {})
+            # (fresh copy: these tools edit it in place)
+            metadata = project.get_metadata()
             submodules = metadata.get('submodules', [])
 
             # Find submodule to remove
@@ -2126,20 +2220,16 @@ def pm_remove_submodule(input: RemoveSubmoduleInput) -> Dict[str, Any]:
                     hints=["pm_list_submodules to see available submodules"]
                 )
 
-            # Update issues if needed
-            issues_updated = 0
-            if input.reassign_issues_to is not None:
-                # Find all issues with this module
-                issues = PMDatabase.find_issues(pid, module=input.name)
-                for issue in issues:
-                    issue.module = input.reassign_issues_to
-                    issue.save()
-                    issues_updated += 1
+            with db_proxy.atomic():
+                # Update issues if needed
+                issues_updated = 0
+                if input.reassign_issues_to is not None:
+                    issues_updated = PMDatabase.bulk_reassign_module(
+                        project, input.name, input.reassign_issues_to
+                    )
 
-            # Update metadata
-            metadata['submodules'] = new_submodules
-            project.metadata = json.dumps(metadata)
-            project.save()
+                # Update metadata (re-read and matched by name in one transaction)
+                PMDatabase.remove_project_submodule(project, input.name)
 
             return standard_response(
                 success=True,
@@ -2153,11 +2243,10 @@ def pm_remove_submodule(input: RemoveSubmoduleInput) -> Dict[str, Any]:
             )
 
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to remove submodule: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}}
+            data={"error_details": _error_details(e)}
         )
 
 @conditional_mcp_tool
@@ -2168,7 +2257,7 @@ def pm_list_submodules(input: ListSubmodulesInput) -> Dict[str, Any]:
     Shows submodule configuration and issue distribution.
     """
     try:
-        with DatabaseSession():
+        with ReadOnlyDatabaseSession():
             # Get project
             pid = _require_project_id(input.project_id)
             project = PMDatabase.get_project(pid)
@@ -2179,8 +2268,8 @@ def pm_list_submodules(input: ListSubmodulesInput) -> Dict[str, Any]:
                 )
 
             # Get project metadata
-            project_dict = PMDatabase._project_to_dict(project)
-            metadata = project_dict.get('metadata', {})
+            # (fresh copy: these tools edit it in place)
+            metadata = project.get_metadata()
             submodules = metadata.get('submodules', [])
 
             if not submodules:
@@ -2195,27 +2284,19 @@ def pm_list_submodules(input: ListSubmodulesInput) -> Dict[str, Any]:
 
             # Add statistics if requested
             if input.include_stats:
+                # Issue counts for every module in one query
+                module_counts = PMDatabase.get_module_issue_counts(pid)
                 for submodule in submodules:
-                    # Get issue counts for this submodule
-                    issues = PMDatabase.find_issues(pid, module=submodule['name'])
+                    counts = module_counts.get(submodule['name'], {})
 
                     # Calculate stats
                     stats = {
-                        'total_issues': len(issues),
-                        'by_status': {},
-                        'by_priority': {},
+                        'total_issues': counts.get('total', 0),
+                        'by_status': counts.get('by_status', {}),
+                        'by_priority': counts.get('by_priority', {}),
                         'completion_rate': 0.0
                     }
 
-                    for issue in issues:
-                        # Status counts
-                        status = issue.status
-                        stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
-
-                        # Priority counts
-                        priority = issue.priority
-                        stats['by_priority'][priority] = stats['by_priority'].get(priority, 0) + 1
-
                     # Calculate completion rate
                     done_count = stats['by_status'].get('done', 0) + stats['by_status'].get('archived', 0)
                     if stats['total_issues'] > 0:
@@ -2230,19 +2311,18 @@ def pm_list_submodules(input: ListSubmodulesInput) -> Dict[str, Any]:
                     "submodules": submodules,
                     "count": len(submodules),
                     "project": {
-                        "id": project_dict['project_id'],
-                        "slug": project_dict['project_slug'],
-                        "path": project_dict['absolute_path']
+                        "id": project.project_id,
+                        "slug": project.project_slug,
+                        "path": project.absolute_path
                     }
                 }
             )
 
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to list submodules: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}}
+            data={"error_details": _error_details(e)}
         )
 
 @conditional_mcp_tool
@@ -2266,12 +2346,11 @@ def pm_estimate(input: EstimateIssueInput) -> Dict[str, Any]:
                 f"pm_start_work --issue-key {input.issue_key} to begin implementation"
             ])
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to update estimate: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
-            hints=["Check issue exists", "Verify estimate format (e.g., '2-3 days', '1 week')"]
+            data={"error_details": _error_details(e)},
+            hints=_ESTIMATE_ERROR_HINTS
         )
 
 @conditional_mcp_tool
@@ -2279,12 +2358,10 @@ def pm_create_task(input: CreateTaskInput) -> Dict[str, Any]:
     """Create a task within an issue for work breakdown"""
     try:
         with DatabaseSession():
-            issue = PMDatabase.get_issue(input.issue_key)
-            if not issue:
+            task = PMDatabase.create_task_for_issue_key(input.issue_key, input.title, input.assignee, input.details)
+            if not task:
                 return err(f"Issue not found: {input.issue_key}")
 
-            task = PMDatabase.create_task(issue, input.title, input.assignee, input.details)
-
             return ok("Task created", {
                 "task_id": task.task_id,
                 "title": task.title,
@@ -2295,25 +2372,25 @@ def pm_create_task(input: CreateTaskInput) -> Dict[str, Any]:
                 f"pm_log_work --issue-key {input.issue_key} --task-id {task.task_id} to log task work"
             ])
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to create task: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
-            hints=["Check issue exists", "Verify task doesn't already exist"]
+            data={"error_details": _error_details(e)},
+            hints=_CREATE_TASK_ERROR_HINTS
         )
 
 @conditional_mcp_tool
 def pm_update_task(input: UpdateTaskInput) -> Dict[str, Any]:
     """Update task status, title, assignee, or details"""
+    if input.status is not None and input.status not in _VALID_TASK_STATUSES:
+        return err(f"Invalid task status: {input.status}", hints=_UPDATE_TASK_ERROR_HINTS)
+
     try:
         with DatabaseSession():
-            task = PMDatabase.get_task(input.task_id)
+            task = PMDatabase.update_task_by_id(input.task_id, input.title, input.status, input.assignee, input.details)
             if not task:
                 return err(f"Task not found: {input.task_id}")
 
-            task = PMDatabase.update_task(task, input.title, input.status, input.assignee, input.details)
-
             return ok("Task updated", {
                 "task_id": task.task_id,
                 "title": task.title,
@@ -2321,12 +2398,11 @@ def pm_update_task(input: UpdateTaskInput) -> Dict[str, Any]:
                 "assignee": task.assignee
             })
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to update task: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
-            hints=["Check task exists", "Verify status is valid (todo, doing, blocked, review, done)"]
+            data={"error_details": _error_details(e)},
+            hints=_UPDATE_TASK_ERROR_HINTS
         )
 
 @conditional_mcp_tool
@@ -2342,31 +2418,30 @@ def pm_git_status(project_id: Optional[str] = None) -> Dict[str, Any]:
             if not project:
                 return err(f"Project not found: {pid}")
 
-            project_dict = PMDatabase._project_to_dict(project)
-            repo_path = project_dict.get('vcs', {}).get('git_root', project_dict['absolute_path'])
+            project_slug = project.project_slug
+            repo_path = PMDatabase.get_repo_path(project)
 
-            br = git_current_branch(repo_path)
-            st = git_status(repo_path)
+        # Git runs outside the session so the pooled connection is not held
+        st = git_status_with_branch(repo_path)
 
-            data = {
-                "project": project_dict['project_slug'],
-                "branch": br["out"] if br["rc"] == 0 else None,
-                "status": st["out"] if st["rc"] == 0 else "",
-                "has_changes": bool(st["out"].strip()) if st["rc"] == 0 else False
-            }
+        data = {
+            "project": project_slug,
+            "branch": st["branch"],
+            "status": st["out"] if st["rc"] == 0 else "",
+            "has_changes": bool(st["out"].strip()) if st["rc"] == 0 else False
+        }
 
-            hints = []
-            if st["out"]:
-                hints.append("You have local changes. Consider committing before push.")
+        hints = []
+        if st["out"]:
+            hints.append("You have local changes. Consider committing before push.")
 
-            return ok("Git status", data, hints=hints)
+        return ok("Git status", data, hints=hints)
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to get git status: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
-            hints=["Check if you're in a git repository", "Verify git is installed"]
+            data={"error_details": _error_details(e)},
+            hints=_GIT_STATUS_ERROR_HINTS
         )
 
 @conditional_mcp_tool
@@ -2382,31 +2457,30 @@ def pm_push_branch(project_id: Optional[str] = None, remote: str = "origin") ->
             if not project:
                 return err(f"Project not found: {pid}")
 
-            project_dict = PMDatabase._project_to_dict(project)
-            repo_path = project_dict.get('vcs', {}).get('git_root', project_dict['absolute_path'])
+            repo_path = PMDatabase.get_repo_path(project)
 
-            res = git_push_current(repo_path, remote=remote)
-            if res["rc"] != 0:
-                return err("Push failed", {"stderr": res["err"]})
+        # Push runs outside the session so the pooled connection is not held
+        res = git_push_current(repo_path, remote=remote)
+        if res["rc"] != 0:
+            return err("Push failed", {"stderr": res["err"]})
 
-            return ok("Branch pushed", {
-                "stdout": res["out"],
-                "remote": remote
-            }, hints=["Create a PR in your VCS host if desired."])
+        return ok("Branch pushed", {
+            "stdout": res["out"],
+            "remote": remote
+        }, hints=_PUSH_BRANCH_HINTS)
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to push branch: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
-            hints=["Check remote exists", "Verify git credentials are configured"]
+            data={"error_details": _error_details(e)},
+            hints=_PUSH_BRANCH_ERROR_HINTS
         )
 
 @conditional_mcp_tool
 def pm_project_dashboard(input: ProjectDashboardInput) -> Dict[str, Any]:
     """Get comprehensive project dashboard with metrics"""
     try:
-        with DatabaseSession():
+        with ReadOnlyDatabaseSession():
             pid = input.project_id or get_default_project_id()
             if not pid:
                 return err("No project_id provided and PM_DEFAULT_PROJECT_ID is not set")
@@ -2415,7 +2489,7 @@ def pm_project_dashboard(input: ProjectDashboardInput) -> Dict[str, Any]:
             if not project:
                 return err(f"Project not found: {pid}")
 
-            project_dict = PMDatabase._project_to_dict(project)
+            project_dict = _project_dict_cached(project)
             metrics = PMDatabase.project_metrics(project)
 
             return ok("Project dashboard", {
@@ -2424,11 +2498,10 @@ def pm_project_dashboard(input: ProjectDashboardInput) -> Dict[str, Any]:
                 "timeframe": input.timeframe
             })
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to compute dashboard: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}},
+            data={"error_details": _error_details(e)},
             hints=["Check database connectivity", "Verify project exists"]
         )
 
@@ -2440,79 +2513,15 @@ def pm_reminder() -> Dict[str, Any]:
     Returns best practices and workflow reminders for consistent PM usage.
     """
     try:
-        reminders = """# PM System Workflow Reminders
-
-## 🎯 Core Philosophy
-**When developing, ALWAYS think about reporting and documenting progress from the PM perspective.**
-
-## 📝 Essential Reminders
-
-### 1. Always Use PM Tools Throughout Work
-- **Start work properly**: Use `pm_start_work` when beginning an issue
-- **Log progress regularly**: Use `pm_log_work` to document what you're doing
-- **Update status**: Use `pm_update_status` when moving between stages
-
-### 2. Use PM-Specific Git Commands
-- **Always use `pm_commit`** instead of regular git commit
-  - It adds proper PM trailers and links to issues
-  - Example: `pm_commit --issue-key PROJ-001 --message "feat: add auth"`
-- **Create branches with PM**: Use `pm_create_branch` for consistent naming
-
-### 3. Document Everything
-- **Log work regularly**: Don't wait until the end - log as you go
-  - After implementing a feature: `pm_log_work --activity code`
-  - After fixing a bug: `pm_log_work --activity debug`
-  - When blocked: `pm_log_work --activity blocked`
-- **Include artifacts**: Reference files, decisions, and blockers in logs
-
-### 4. Status Updates Are Critical
-- **Proposed** → **In Progress**: When starting work
-- **In Progress** → **Review**: When ready for review
-- **Review** → **Done**: After approval and merge
-- **Any** → **Blocked**: When encountering blockers
-
-### 5. Break Down Complex Work
-- Use `pm_create_task` to split issues into manageable pieces
-- Track progress on individual tasks with `pm_update_task`
-
-## 🚀 Quick Workflow Checklist
-
-Before starting work:
-✅ `pm_status` - Check project health
-✅ `pm_my_queue` - Get your prioritized work
-✅ `pm_get_issue --issue-key XXX` - Understand the full context
-
-During work:
-✅ `pm_start_work --issue-key XXX` - Mark as in progress
-✅ `pm_log_work` - Document progress (multiple times!)
-✅ `pm_commit` - Use PM commits, not regular git
-
-After completing:
-✅ `pm_update_status --status done` - Mark complete
-✅ `pm_log_work --activity review` - Log final summary
-
-## 💡 Pro Tips
-- Call `pm_reminder` periodically during long sessions
-- Use `pm_docs` for detailed command documentation
-- Run `pm_daily_standup` to generate status reports
-- Check `pm_blocked_issues` to help unblock work
-
-Remember: **The PM system is your development companion, not an afterthought!**"""
-
         return ok("PM workflow reminders", {
-            "reminders": reminders,
-            "last_reminder": datetime.utcnow().isoformat() + 'Z'
-        }, hints=[
-            "Call pm_reminder periodically to maintain PM discipline",
-            "Use pm_docs for detailed command reference",
-            "Always prefer PM tools over direct git/file operations"
-        ])
+            "reminders": REMINDER_CONTENT,
+            "last_reminder": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        }, hints=_REMINDER_HINTS)
     except Exception as e:
-        tb = traceback.format_exc()
         return standard_response(
             success=False,
             message=f"Failed to get reminders: {type(e).__name__}",
-            data={"error_details": {"error": str(e), "traceback": tb}}
+            data={"error_details": _error_details(e)}
         )
 
 if __name__ == "__main__":
@@ -3,11 +3,14 @@ import re
 import asyncio
 import subprocess
 import json
+import hashlib
 import os
 import functools
+import contextvars
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, Callable, TypeVar, cast
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union, Callable, TypeVar, cast
 from slugify import slugify
 from config import Config
 
@@ -17,6 +20,23 @@ def now_iso() -> str:
     """Get current timestamp in ISO format"""
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
+@functools.lru_cache(maxsize=4096)
+def parse_utc(value: str) -> datetime:
+    """Parse a serialized UTC timestamp ('...Z') into a naive UTC datetime.
+
+    Cached on the exact string: created_utc/updated_utc values are immutable
+    per row, so queue and blocker reports re-parse the same strings often.
+    """
+    return datetime.fromisoformat(value.rstrip('Z'))
+
+def stable_project_id(path: Union[str, Path]) -> str:
+    """Derive a project ID from its path that is stable across processes.
+
+    Built-in hash() is salted per interpreter run, so it cannot be used here.
+    """
+    digest = hashlib.blake2b(str(path).encode('utf-8'), digest_size=8).hexdigest()
+    return f"pn_{digest}"
+
 def safe_json(value, default):
     """Safely parse JSON with fallback"""
     if value is None:
@@ -41,12 +61,53 @@ def safe_json_loads(val, default=None):
     except Exception:
         return default
 
-def _path_is_within(child: Path, parent: Path) -> bool:
-    try:
-        child.resolve().relative_to(parent.resolve())
-        return True
-    except Exception:
-        return False
+# Resolved project roots as (path, project_id) in get_all_projects() order, and
+# the cwd -> project_id answers matched against them. Roots are reloaded when
+# a cwd matches nothing; clear_project_path_cache() drops both.
+_project_roots: Optional[List[Tuple[str, str]]] = None
+_cwd_project_ids: Dict[str, str] = {}
+
+def _load_project_roots(PMDatabase) -> List[Tuple[str, str]]:
+    """Resolve every project's absolute_path once"""
+    roots = []
+    for p in PMDatabase.get_all_projects():  # returns *models*
+        try:
+            roots.append((str(Path(p.absolute_path).resolve()), p.project_id))
+        except Exception:
+            continue
+    return roots
+
+def _match_project_root(cwd: str, roots: List[Tuple[str, str]]) -> Optional[str]:
+    """First project whose root is cwd or one of its parents"""
+    for root, project_id in roots:
+        # exact repo or subdir
+        if cwd == root or cwd.startswith(root + os.sep):
+            return project_id
+    return None
+
+def project_id_for_cwd(PMDatabase, cwd: str) -> Optional[str]:
+    """Memoized CWD -> project lookup; only misses touch the DB or filesystem"""
+    global _project_roots
+    project_id = _cwd_project_ids.get(cwd)
+    if project_id:
+        return project_id
+
+    resolved = str(Path(cwd).resolve())
+    if _project_roots is not None:
+        project_id = _match_project_root(resolved, _project_roots)
+    if not project_id:
+        # Projects may have been added since the roots were loaded
+        _project_roots = _load_project_roots(PMDatabase)
+        project_id = _match_project_root(resolved, _project_roots)
+    if project_id:
+        _cwd_project_ids[cwd] = project_id
+    return project_id
+
+def clear_project_path_cache() -> None:
+    """Forget resolved project roots, e.g. after a project is created"""
+    global _project_roots
+    _project_roots = None
+    _cwd_project_ids.clear()
 
 def resolve_project_id_from_env_or_cwd(PMDatabase) -> Optional[str]:
     """
@@ -62,15 +123,9 @@ def resolve_project_id_from_env_or_cwd(PMDatabase) -> Optional[str]:
             return env_pid
 
     # 2) CWD match (including submodules)
-    cwd = Path.cwd()
-    for p in PMDatabase.get_all_projects():  # returns *models*
-        try:
-            project_path = Path(p.absolute_path).resolve()
-        except Exception:
-            continue
-        # Check if CWD is within project path
-        if cwd == project_path or _path_is_within(cwd, project_path):
-            return p.project_id
+    project_id = project_id_for_cwd(PMDatabase, os.getcwd())
+    if project_id:
+        return project_id
 
     # 3) In global mode, could return None to trigger auto-initialization
     return None
@@ -78,6 +133,16 @@ def resolve_project_id_from_env_or_cwd(PMDatabase) -> Optional[str]:
 class ScopeError(Exception):
     pass
 
+# Project resolved by strict_project_scope for the tool call in progress, so
+# tool bodies whose input has no project_id field need not resolve it again
+_scoped_project_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "pm_scoped_project_id", default=None
+)
+
+def scoped_project_id() -> Optional[str]:
+    """Project id resolved by strict_project_scope for the current tool call"""
+    return _scoped_project_id.get()
+
 def strict_project_scope(tool_fn: Callable[..., T]) -> Callable[..., T]:
     """
     Project scoping decorator with global mode support:
@@ -92,7 +157,6 @@ def strict_project_scope(tool_fn: Callable[..., T]) -> Callable[..., T]:
             input_obj = args[1]
 
         from database import PMDatabase, DatabaseSession, Project  # local import to avoid cycles
-        from datetime import datetime
 
         # Check if in global mode (no PM_DEFAULT_PROJECT_ID)
         is_global = Config.DEFAULT_PROJECT_ID is None
@@ -119,13 +183,12 @@ def strict_project_scope(tool_fn: Callable[..., T]) -> Callable[..., T]:
                     if is_git_repo or has_project_files:
                         # Create new project
                         project_slug = cwd.name.lower().replace(' ', '-')
-                        project_id = f"pn_{abs(hash(str(cwd))) % (10**16)}"
+                        project_id = stable_project_id(cwd)
 
                         # Check if already exists
-                        existing = [p for p in PMDatabase.get_all_projects()
-                                  if Path(p.absolute_path).resolve() == cwd]
+                        existing = PMDatabase.get_project_by_path(cwd)
                         if existing:
-                            resolved = existing[0].project_id
+                            resolved = existing.project_id
                         else:
                             metadata = {
                                 "vcs": {"git_root": str(cwd), "default_branch": "main"},
@@ -166,14 +229,18 @@ def strict_project_scope(tool_fn: Callable[..., T]) -> Callable[..., T]:
                     raise ScopeError(f"Project scope mismatch. Resolved={resolved}, Passed={passed}.")
             setattr(input_obj, "project_id", resolved)
 
-        return cast(T, tool_fn(*args, **kwargs))
+        token = _scoped_project_id.set(resolved)
+        try:
+            return cast(T, tool_fn(*args, **kwargs))
+        finally:
+            _scoped_project_id.reset(token)
     return wrapper
 
 def assert_issue_in_scope(issue_project_id: Optional[str], scoped_project_id: str) -> None:
     if not issue_project_id or issue_project_id != scoped_project_id:
         raise ScopeError("Issue does not belong to the current project scope.")
 
-def ok(message: str, data: Optional[Dict[str, Any]] = None, hints: Optional[List[str]] = None) -> Dict[str, Any]:
+def ok(message: str, data: Optional[Dict[str, Any]] = None, hints: Optional[Sequence[str]] = None) -> Dict[str, Any]:
     """Create success response"""
     return {
         "success": True,
@@ -183,7 +250,7 @@ def ok(message: str, data: Optional[Dict[str, Any]] = None, hints: Optional[List
         "timestamp": now_iso(),
     }
 
-def err(message: str, details: Optional[Dict[str, Any]] = None, hints: Optional[List[str]] = None) -> Dict[str, Any]:
+def err(message: str, details: Optional[Dict[str, Any]] = None, hints: Optional[Sequence[str]] = None) -> Dict[str, Any]:
     """Create error response"""
     return {
         "success": False,
@@ -224,6 +291,7 @@ def generate_issue_key(project_slug: str, existing_count: int) -> str:
     # Add 1 to existing count to get next number
     return f"{prefix}-{date_part}-{existing_count + 1:03d}"
 
+@functools.lru_cache(maxsize=1024)
 def generate_branch_name(issue_key: str, issue_type: str, title: str) -> str:
     """Generate git branch name from issue details"""
     type_map = {
@@ -239,14 +307,18 @@ def generate_branch_name(issue_key: str, issue_type: str, title: str) -> str:
 
     return f"{type_prefix}/{issue_key.lower()}-{title_slug}"
 
+# Conventional commit header; properly handles scopes like feat(api):
+_CONVENTIONAL_COMMIT_RE = re.compile(
+    r'^(?P<type>feat|fix|docs|style|refactor|test|chore)(?P<scope>\([^)]+\))?:\s*(?P<rest>.*)',
+    re.DOTALL
+)
+
 def format_commit_message(issue_key: str, message: str) -> str:
     """
     Format commit message with PM trailers - FIXED REGEX VERSION
     Handles conventional commit format properly including scopes
     """
-    # Fixed regex that properly handles scopes like feat(api):
-    cc_pattern = r'^(?P<type>feat|fix|docs|style|refactor|test|chore)(?P<scope>\([^)]+\))?:\s*(?P<rest>.*)'
-    match = re.match(cc_pattern, message, re.DOTALL)
+    match = _CONVENTIONAL_COMMIT_RE.match(message)
 
     if match:
         # Insert preamble properly
@@ -285,13 +357,16 @@ def parse_timeframe(timeframe: str) -> timedelta:
     else:
         return timedelta(weeks=1)
 
+# Duration formats like "2h", "30m", "1.5d", "2.5h"
+_DURATION_RE = re.compile(r'^(\d+(?:\.\d+)?)([hmd])$')
+
+@functools.lru_cache(maxsize=256)
 def parse_duration(duration: str) -> float:
     """Parse duration string to hours with decimal support"""
     if not duration:
         return 0.0
 
-    # Handle formats like "2h", "30m", "1.5d", "2.5h"
-    match = re.match(r'^(\d+(?:\.\d+)?)([hmd])$', duration.lower())
+    match = _DURATION_RE.match(duration.lower())
     if not match:
         return 0.0
 
@@ -437,8 +512,7 @@ def calculate_velocity(completed_issues: List[Dict[str, Any]],
 
         for issue in completed_issues:
             try:
-                updated_str = issue['updated_utc'].rstrip('Z')
-                updated_dt = datetime.fromisoformat(updated_str)
+                updated_dt = parse_utc(issue['updated_utc'])
                 if updated_dt > cutoff:
                     recent_issues.append(issue)
             except (ValueError, KeyError):
@@ -450,8 +524,8 @@ def calculate_velocity(completed_issues: List[Dict[str, Any]],
         cycle_times = []
         for issue in recent_issues:
             try:
-                created = datetime.fromisoformat(issue['created_utc'].rstrip('Z'))
-                completed = datetime.fromisoformat(issue['updated_utc'].rstrip('Z'))
+                created = parse_utc(issue['created_utc'])
+                completed = parse_utc(issue['updated_utc'])
                 cycle_hours = (completed - created).total_seconds() / 3600
                 if cycle_hours > 0:  # Sanity check
                     cycle_times.append(cycle_hours)
@@ -478,10 +552,11 @@ def calculate_velocity(completed_issues: List[Dict[str, Any]],
 
 def format_standup_report(yesterday_work: List[Dict[str, Any]],
                          today_plan: List[Dict[str, Any]],
-                         blockers: List[Dict[str, Any]]) -> str:
+                         blockers: List[Dict[str, Any]],
+                         date_str: Optional[str] = None) -> str:
     """Format daily standup report with rich context"""
     report = "# Daily Standup Report\n\n"
-    report += f"**Date:** {datetime.now().strftime('%Y-%m-%d')}\n\n"
+    report += f"**Date:** {date_str or datetime.now().strftime('%Y-%m-%d')}\n\n"
 
     report += "## Yesterday's Progress\n"
     if yesterday_work:
@@ -515,15 +590,31 @@ def format_standup_report(yesterday_work: List[Dict[str, Any]],
 
     return report
 
-def analyze_dependencies(issue: Dict[str, Any], all_issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+def build_dependency_index(all_issues: List[Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """Index issues by key and by the keys they depend on, in a single pass.
+
+    Build this once per request and pass it to analyze_dependencies() so each
+    lookup is a dict hit instead of a scan over all_issues.
+    """
+    by_key: Dict[str, Dict[str, Any]] = {}
+    blocked_by: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for other_issue in all_issues:
+        by_key.setdefault(other_issue['key'], other_issue)
+        for dep_key in dict.fromkeys(other_issue.get('dependencies', [])):
+            blocked_by[dep_key].append(other_issue)
+    return by_key, blocked_by
+
+def analyze_dependencies(issue: Dict[str, Any], all_issues: List[Dict[str, Any]],
+                         index: Optional[Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]] = None) -> Dict[str, Any]:
     """Analyze issue dependencies and blocking relationships"""
     issue_key = issue['key']
     dependencies = issue.get('dependencies', [])
+    by_key, blocked_by = index if index is not None else build_dependency_index(all_issues)
 
     # Find what this issue depends on
     depends_on = []
     for dep_key in dependencies:
-        dep_issue = next((i for i in all_issues if i['key'] == dep_key), None)
+        dep_issue = by_key.get(dep_key)
         if dep_issue:
             depends_on.append({
                 'key': dep_key,
@@ -541,13 +632,12 @@ def analyze_dependencies(issue: Dict[str, Any], all_issues: List[Dict[str, Any]]
 
     # Find what depends on this issue
     blocks = []
-    for other_issue in all_issues:
-        if issue_key in other_issue.get('dependencies', []):
-            blocks.append({
-                'key': other_issue['key'],
-                'title': other_issue['title'],
-                'status': other_issue['status']
-            })
+    for other_issue in blocked_by.get(issue_key, ()):
+        blocks.append({
+            'key': other_issue['key'],
+            'title': other_issue['title'],
+            'status': other_issue['status']
+        })
 
     # Calculate readiness
     ready_to_work = len(depends_on) == 0 or all(d['ready'] for d in depends_on)
@@ -570,7 +660,7 @@ def calculate_urgency_score(issue: Dict[str, Any]) -> float:
         priority_score = priority_scores.get(issue.get('priority', 'P3'), 60)
 
         # Age factor (older issues get slight boost)
-        created = datetime.fromisoformat(issue['created_utc'].rstrip('Z'))
+        created = parse_utc(issue['created_utc'])
         age_days = (datetime.utcnow() - created).days
         age_score = min(age_days * 2, 20)  # Cap at 20 points
 
@@ -605,6 +695,19 @@ def sanitize_git_output(output: str, error: str) -> Dict[str, str]:
         'error': sanitized_error
     }
 
+# First line of `git commit` output: "[main abc1234] subject",
+# "[main (root-commit) abc1234] subject", "[detached HEAD abc1234] subject"
+_COMMIT_SHA_RE = re.compile(r'^\[.+? ([0-9a-f]{7,})\]')
+
+def parse_commit_sha(commit_output: str) -> Optional[str]:
+    """Extract the abbreviated commit SHA from `git commit` output, if present"""
+    match = _COMMIT_SHA_RE.match(commit_output or '')
+    return match.group(1)[:7] if match else None
+
+# Sequences git refuses in branch names: '..', '~', '^', ':', '?', '*', '[', '\\', ' '
+_BRANCH_INVALID_RE = re.compile(r'\.\.|[~^:?*\[\\ ]')
+
+@functools.lru_cache(maxsize=1024)
 def validate_branch_name(branch_name: str) -> bool:
     """Validate git branch name"""
     # Git branch name rules
@@ -620,8 +723,7 @@ def validate_branch_name(branch_name: str) -> bool:
         return False
 
     # Cannot contain special characters
-    invalid_chars = ['..', '~', '^', ':', '?', '*', '[', '\\', ' ']
-    if any(char in branch_name for char in invalid_chars):
+    if _BRANCH_INVALID_RE.search(branch_name):
         return False
 
     return True
@@ -845,31 +947,19 @@ def create_pr_template(issue: Dict[str, Any]) -> Dict[str, str]:
     }
 
 async def ensure_project_git_setup(project_path: Path) -> bool:
-    """Ensure project has proper git setup"""
-    try:
-        # Check if it's a git repo
-        result = await run_git_command_async(['status'], cwd=project_path)
-        if not result['success']:
-            # Initialize git repo if not exists
-            init_result = await run_git_command_async(['init'], cwd=project_path)
-            if not init_result['success']:
-                return False
+    """Ensure project has proper git setup - async wrapper around
+    ensure_project_git_setup_sync, sharing its once-per-repo cache"""
+    return await asyncio.to_thread(ensure_project_git_setup_sync, project_path)
 
-        # Setup git identity
-        await run_git_command_async(
-            ['config', 'user.name', Config.GIT_USER_NAME or 'PM Agent'],
-            cwd=project_path
-        )
-        await run_git_command_async(
-            ['config', 'user.email', Config.GIT_USER_EMAIL or 'pm@local'],
-            cwd=project_path
-        )
-        return True
-    except Exception:
-        return False
+# Repo paths whose git setup already succeeded in this process; identity
+# config is persistent in .git/config so it only needs writing once.
+_git_setup_done: set = set()
 
 def ensure_project_git_setup_sync(project_path: Path) -> bool:
     """Synchronous version - ensure project has proper git setup"""
+    cache_key = str(Path(project_path).resolve())
+    if cache_key in _git_setup_done:
+        return True
     try:
         # Check if it's a git repo
         result = run_git_command_sync(['status'], cwd=project_path)
@@ -888,10 +978,27 @@ def ensure_project_git_setup_sync(project_path: Path) -> bool:
             ['config', 'user.email', Config.GIT_USER_EMAIL or 'pm@local'],
             cwd=project_path
         )
+        _git_setup_done.add(cache_key)
         return True
     except Exception:
         return False
 
+# Repos known to have a remote configured, so local-only repos skip a
+# `git pull` that can only fail. Only positive answers are remembered: a
+# repo created by pm_init_project usually gets `git remote add` later.
+_has_remote_cache: set = set()
+
+def repo_has_remote(repo_path: Path) -> bool:
+    """True if `git remote` lists at least one remote for the repo"""
+    cache_key = str(Path(repo_path).resolve())
+    if cache_key in _has_remote_cache:
+        return True
+    result = run_git_command_sync(['remote'], cwd=repo_path)
+    if result['success'] and result['output']:
+        _has_remote_cache.add(cache_key)
+        return True
+    return False
+
 class RateLimiter:
     """Simple rate limiter for git operations"""
     def __init__(self, max_operations: int = 10, window_seconds: int = 60):